@@ -1487,7 +1487,8 @@ class GameSyncTUI(App):
                 config = self.config_manager.load_config()
                 self.logger = init_logger(
                     self.config_manager.logs_dir, 
-                    config.get("general", {}).get("log_level", "INFO").upper()
+                    config.get("general", {}).get("log_level", "INFO").upper(),
+                    console=False
                 )
                 self.logger.info("TUI started")
         except Exception as e:
@@ -3,14 +3,23 @@ Configuration management module
 Handles loading, saving, and initializing configuration files
 """
 
+import copy
 import os
 import platform
 import socket
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import toml
 
 
+# Validation tables, built once at import
+REQUIRED_SECTIONS = ("system", "general", "detection")
+GAME_REQUIRED_SECTIONS = ("game", "paths", "sync")
+VALID_OS_TYPES = frozenset(("linux", "windows"))
+LOG_LEVELS = ("debug", "info", "warning", "error")
+VALID_LOG_LEVELS = frozenset(LOG_LEVELS)
+
+
 class ConfigError(Exception):
     """Configuration-related errors"""
     pass
@@ -35,6 +44,9 @@ class ConfigManager:
         self.backups_dir = self.config_dir / "backups"
         self.logs_dir = self.config_dir / "logs"
         self.config_file = self.config_dir / "config.toml"
+        
+        # Parsed global config keyed by the (mtime_ns, size) of config.toml
+        self._config_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
     
     def get_os_type(self) -> str:
         """Detect operating system type
@@ -101,17 +113,28 @@ class ConfigManager:
     def load_config(self) -> Dict[str, Any]:
         """Load global configuration
         
+        The parsed and validated config is cached until config.toml changes
+        on disk; each call returns a fresh copy that callers may modify.
+        
         Returns:
             Configuration dictionary
             
         Raises:
             ConfigError: If config file doesn't exist or is invalid
         """
-        if not self.config_file.exists():
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
             raise ConfigError(
                 f"Configuration file not found: {self.config_file}\n"
                 f"Run 'init' command to create it."
             )
+        except OSError as e:
+            raise ConfigError(f"Error reading config file: {e}")
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if self._config_cache is not None and self._config_cache[0] == key:
+            return copy.deepcopy(self._config_cache[1])
         
         try:
             with open(self.config_file, 'r') as f:
@@ -123,6 +146,7 @@ class ConfigManager:
         
         # Validate config
         self._validate_config(config)
+        self._config_cache = (key, copy.deepcopy(config))
         return config
     
     def _validate_config(self, config: Dict[str, Any]):
@@ -135,15 +159,14 @@ class ConfigManager:
             ConfigError: If configuration is invalid
         """
         # Check required sections
-        required_sections = ["system", "general", "detection"]
-        for section in required_sections:
+        for section in REQUIRED_SECTIONS:
             if section not in config:
                 raise ConfigError(f"Missing required section: [{section}]")
         
         # Validate system section
         if "os" not in config["system"]:
             raise ConfigError("Missing 'os' in [system] section")
-        if config["system"]["os"] not in ["linux", "windows"]:
+        if config["system"]["os"] not in VALID_OS_TYPES:
             raise ConfigError(f"Invalid os value: {config['system']['os']} (must be 'linux' or 'windows')")
         
         # Validate general section
@@ -152,11 +175,10 @@ class ConfigManager:
         
         # Validate log_level if present
         if "log_level" in config["general"]:
-            valid_levels = ["debug", "info", "warning", "error"]
-            if config["general"]["log_level"] not in valid_levels:
+            if config["general"]["log_level"] not in VALID_LOG_LEVELS:
                 raise ConfigError(
                     f"Invalid log_level: {config['general']['log_level']} "
-                    f"(must be one of: {', '.join(valid_levels)})"
+                    f"(must be one of: {', '.join(LOG_LEVELS)})"
                 )
     
     def save_config(self, config: Dict[str, Any]):
@@ -171,6 +193,7 @@ class ConfigManager:
         # Validate before saving
         self._validate_config(config)
         
+        self._config_cache = None
         try:
             with open(self.config_file, 'w') as f:
                 toml.dump(config, f)
@@ -217,8 +240,7 @@ class ConfigManager:
             ConfigError: If configuration is invalid
         """
         # Check required sections
-        required_sections = ["game", "paths", "sync"]
-        for section in required_sections:
+        for section in GAME_REQUIRED_SECTIONS:
             if section not in config:
                 raise ConfigError(f"Game '{game_id}': Missing required section [{section}]")
         
@@ -1,10 +1,37 @@
 """Conflict resolution for game save synchronization"""
 
+import hashlib
+import os
+import shutil
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    from blake3 import blake3
+except ImportError:  # Optional, falls back to HASH_ALGORITHM
+    blake3 = None
+
+
+HASH_CHUNK_SIZE = 1 << 18
+
+# OpenSSL runs SHA-256 on the CPU's SHA extensions (x86 SHA-NI, ARMv8
+# crypto), which beats BLAKE2b's portable code on current hardware.
+# BLAKE3 is faster still (SIMD across chunks) and is used when installed.
+HASH_ALGORITHM = "sha256"
+
+
+def _timestamp() -> str:
+    """Current local time as YYYYMMDD-HHMMSS, for backup and rename suffixes
+    
+    Formats time.localtime() fields directly instead of going through
+    datetime.strftime().
+    """
+    t = time.localtime()
+    return f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}-{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+
 
 class ResolutionStrategy(Enum):
     """Conflict resolution strategies"""
@@ -17,8 +44,22 @@ class ResolutionStrategy(Enum):
 class ConflictResolver:
     """Handles conflict detection and resolution"""
     
+    # Digests kept for this many file versions, least recently used dropped first
+    DIGEST_CACHE_MAX_ENTRIES = 256
+    
     def __init__(self):
         self.pending_conflicts = []
+        
+        # (st_dev, st_ino, st_size, st_mtime_ns, st_ctime_ns) -> content digest of the file.
+        # ctime is included because it changes on every write and can't be reset with utime.
+        self._digest_cache: Dict[Tuple[int, int, int, int, int], bytes] = {}
+        
+        # Strategy -> handler(local_path, cloud_path, backup_dir) used by resolve_conflict
+        self._strategies = {
+            ResolutionStrategy.KEEP_LOCAL: self._keep_local,
+            ResolutionStrategy.KEEP_CLOUD: self._keep_cloud,
+            ResolutionStrategy.KEEP_BOTH: self._keep_both,
+        }
     
     def add_conflict(self, local_path: Path, cloud_path: Path):
         """Add a conflict to the pending list
@@ -47,38 +88,126 @@ class ConflictResolver:
         """Clear all pending conflicts"""
         self.pending_conflicts.clear()
     
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        """Stat path, returning None if it doesn't exist"""
+        try:
+            return path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+    
+    @staticmethod
+    def _new_hash():
+        """Create a hash object, BLAKE3 if available else HASH_ALGORITHM"""
+        if blake3 is not None:
+            return blake3()
+        return hashlib.new(HASH_ALGORITHM)
+    
+    @staticmethod
+    def _file_digest(path: Path) -> bytes:
+        """Compute the content digest of a file
+        
+        Args:
+            path: File path
+            
+        Returns:
+            Digest bytes
+        """
+        with open(path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, ConflictResolver._new_hash).digest()
+            digest = ConflictResolver._new_hash()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+            return digest.digest()
+    
+    def _cached_digest(self, path: Path, stat: os.stat_result) -> bytes:
+        """Get a file's digest, reusing it while the file is unchanged
+        
+        At most DIGEST_CACHE_MAX_ENTRIES digests are kept, so long sessions
+        don't hold on to every version of every save they have hashed.
+        
+        Args:
+            path: File path
+            stat: Current stat result for path
+            
+        Returns:
+            Digest bytes
+        """
+        key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+        digest = self._digest_cache.pop(key, None)
+        if digest is None:
+            digest = self._file_digest(path)
+            if len(self._digest_cache) >= self.DIGEST_CACHE_MAX_ENTRIES:
+                # Drop the least recently used entry
+                del self._digest_cache[next(iter(self._digest_cache))]
+        
+        # (Re)insert at the end so the dict stays in least-recently-used order
+        self._digest_cache[key] = digest
+        return digest
+    
+    def _same_contents(self, local_path: Path, cloud_path: Path,
+                       local_stat: os.stat_result, cloud_stat: os.stat_result) -> bool:
+        """Check whether two files of equal size hash to the same digest
+        
+        Args:
+            local_path: Path to local file
+            cloud_path: Path to cloud file
+            local_stat: Stat result for the local file
+            cloud_stat: Stat result for the cloud file
+            
+        Returns:
+            True if both files have identical contents
+        """
+        try:
+            return self._cached_digest(local_path, local_stat) == self._cached_digest(cloud_path, cloud_stat)
+        except OSError:
+            return False
+    
     def detect_conflict(self, local_path: Path, cloud_path: Path, 
-                       last_sync: Optional[str] = None) -> bool:
+                       last_sync: Union[str, float, None] = None) -> bool:
         """Detect if files are in conflict
         
+        Timestamps decide whether both sides changed. Files whose contents are
+        identical are never in conflict, whatever their timestamps.
+        
         Args:
             local_path: Path to local file
             cloud_path: Path to cloud file
-            last_sync: ISO format timestamp of last sync
+            last_sync: ISO format string or POSIX timestamp of last sync
             
         Returns:
             True if conflict detected
         """
-        if not local_path.exists() or not cloud_path.exists():
+        local_stat = self._stat(local_path)
+        cloud_stat = self._stat(cloud_path)
+        if local_stat is None or cloud_stat is None:
             return False
         
-        local_mtime = local_path.stat().st_mtime
-        cloud_mtime = cloud_path.stat().st_mtime
+        local_mtime = local_stat.st_mtime
+        cloud_mtime = cloud_stat.st_mtime
         
         # If no last sync, check if both modified at different times
         if not last_sync:
             # Allow 2 second tolerance for filesystem timestamp precision
-            return abs(local_mtime - cloud_mtime) > 2
-        
-        # Parse last sync timestamp
-        last_sync_dt = datetime.fromisoformat(last_sync)
-        last_sync_ts = last_sync_dt.timestamp()
+            conflict = abs(local_mtime - cloud_mtime) > 2
+        else:
+            # Parse last sync timestamp
+            if isinstance(last_sync, (int, float)):
+                last_sync_ts = float(last_sync)
+            else:
+                last_sync_ts = datetime.fromisoformat(last_sync).timestamp()
+            
+            # Conflict if both modified after last sync
+            local_newer = local_mtime > last_sync_ts + 1
+            cloud_newer = cloud_mtime > last_sync_ts + 1
+            conflict = local_newer and cloud_newer
         
-        # Conflict if both modified after last sync
-        local_newer = local_mtime > last_sync_ts + 1
-        cloud_newer = cloud_mtime > last_sync_ts + 1
+        # Only hash when sizes match; different sizes always differ
+        if conflict and local_stat.st_size == cloud_stat.st_size:
+            return not self._same_contents(local_path, cloud_path, local_stat, cloud_stat)
         
-        return local_newer and cloud_newer
+        return conflict
     
     def create_conflict_backup(self, local_path: Path, cloud_path: Path, 
                               backup_dir: Path) -> Dict[str, Path]:
@@ -94,7 +223,7 @@ class ConflictResolver:
         """
         backup_dir.mkdir(parents=True, exist_ok=True)
         
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        timestamp = _timestamp()
         filename = local_path.name
         
         backups = {}
@@ -102,13 +231,13 @@ class ConflictResolver:
         # Backup local version
         if local_path.exists():
             local_backup = backup_dir / f"{filename}.{timestamp}.local.conflict"
-            local_backup.write_bytes(local_path.read_bytes())
+            shutil.copyfile(local_path, local_backup)
             backups["local"] = local_backup
         
         # Backup cloud version
         if cloud_path.exists():
             cloud_backup = backup_dir / f"{filename}.{timestamp}.cloud.conflict"
-            cloud_backup.write_bytes(cloud_path.read_bytes())
+            shutil.copyfile(cloud_path, cloud_backup)
             backups["cloud"] = cloud_backup
         
         return backups
@@ -129,16 +258,16 @@ class ConflictResolver:
             "cloud": {}
         }
         
-        if local_path.exists():
-            stat = local_path.stat()
+        stat = self._stat(local_path)
+        if stat is not None:
             info["local"] = {
                 "size": stat.st_size,
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 "path": str(local_path)
             }
         
-        if cloud_path.exists():
-            stat = cloud_path.stat()
+        stat = self._stat(cloud_path)
+        if stat is not None:
             info["cloud"] = {
                 "size": stat.st_size,
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
@@ -151,6 +280,9 @@ class ConflictResolver:
                         strategy: ResolutionStrategy, backup_dir: Path) -> bool:
         """Resolve conflict using specified strategy
         
+        Strategies that overwrite a file back up both versions first;
+        KEEP_BOTH only renames, so it leaves backup_dir untouched.
+        
         Args:
             local_path: Path to local file
             cloud_path: Path to cloud file
@@ -160,33 +292,34 @@ class ConflictResolver:
         Returns:
             True if resolution successful
         """
-        # Create backups first
+        handler = self._strategies.get(strategy)
+        if handler is None:
+            return False
+        
+        handler(local_path, cloud_path, backup_dir)
+        return True
+    
+    def _keep_local(self, local_path: Path, cloud_path: Path, backup_dir: Path):
+        """Back up both versions, then copy local to cloud"""
         self.create_conflict_backup(local_path, cloud_path, backup_dir)
+        shutil.copyfile(local_path, cloud_path)
+        cloud_path.touch()  # Update timestamp
+    
+    def _keep_cloud(self, local_path: Path, cloud_path: Path, backup_dir: Path):
+        """Back up both versions, then copy cloud to local"""
+        self.create_conflict_backup(local_path, cloud_path, backup_dir)
+        shutil.copyfile(cloud_path, local_path)
+        local_path.touch()  # Update timestamp
+    
+    @staticmethod
+    def _keep_both(local_path: Path, cloud_path: Path, backup_dir: Path):
+        """Rename both with suffixes"""
+        timestamp = _timestamp()
         
-        if strategy == ResolutionStrategy.KEEP_LOCAL:
-            # Copy local to cloud
-            cloud_path.write_bytes(local_path.read_bytes())
-            cloud_path.touch()  # Update timestamp
-            return True
-        
-        elif strategy == ResolutionStrategy.KEEP_CLOUD:
-            # Copy cloud to local
-            local_path.write_bytes(cloud_path.read_bytes())
-            local_path.touch()  # Update timestamp
-            return True
-        
-        elif strategy == ResolutionStrategy.KEEP_BOTH:
-            # Rename both with suffixes
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            
-            # Rename local
-            local_new = local_path.parent / f"{local_path.stem}.{timestamp}.local{local_path.suffix}"
-            local_path.rename(local_new)
-            
-            # Rename cloud
-            cloud_new = cloud_path.parent / f"{cloud_path.stem}.{timestamp}.cloud{cloud_path.suffix}"
-            cloud_path.rename(cloud_new)
-            
-            return True
+        # Rename local
+        local_new = local_path.parent / f"{local_path.stem}.{timestamp}.local{local_path.suffix}"
+        local_path.rename(local_new)
         
-        return False
+        # Rename cloud
+        cloud_new = cloud_path.parent / f"{cloud_path.stem}.{timestamp}.cloud{cloud_path.suffix}"
+        cloud_path.rename(cloud_new)
@@ -3,10 +3,11 @@ Game detection module
 Handles detection of Steam installation and non-Steam games
 """
 
+import copy
 import os
 import platform
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 from .vdf_parser import ShortcutsParser
@@ -34,20 +35,47 @@ class GameDetector:
         self.userdata_path: Optional[Path] = None
         self.user_ids: List[str] = []
         self.save_detector = SaveLocationDetector(os_type)
-        self.custom_paths = [Path(p) for p in (custom_paths or [])]
+        self.custom_paths: List[Path] = []
+        for custom_path in custom_paths or []:
+            if os.path.isdir(custom_path):
+                self.custom_paths.append(Path(custom_path))
+            else:
+                print(f"Warning: Custom path not found, skipping: {custom_path}")
         self.config_manager = config_manager
+        
+        # Steam is only probed once per instance; user IDs are rescanned when userdata changes
+        self._steam_probed = False
+        self._user_ids_mtime: Optional[int] = None
+        
+        # Cached detect_all() result and the stat signature it was built from
+        self._last_scan_signature: Dict[Path, Optional[Tuple[int, int]]] = {}
+        self._last_scan_results: Optional[Dict[str, Any]] = None
     
     def detect_steam_path(self) -> Optional[Path]:
         """Detect Steam installation path
         
+        The result is cached on the instance; call reset_detection() to probe again.
+        
         Returns:
             Path to Steam installation or None if not found
         """
+        if self._steam_probed:
+            return self.steam_path
+        
+        self._steam_probed = True
         if self.os_type == "linux":
             return self._detect_steam_linux()
         else:
             return self._detect_steam_windows()
     
+    def reset_detection(self):
+        """Forget cached Steam, userdata and user ID detection results"""
+        self.steam_path = None
+        self.userdata_path = None
+        self.user_ids = []
+        self._steam_probed = False
+        self._user_ids_mtime = None
+    
     def _detect_steam_linux(self) -> Optional[Path]:
         """Detect Steam installation on Linux
         
@@ -62,9 +90,9 @@ class GameDetector:
         ]
         
         for path in possible_paths:
-            if path.exists() and path.is_dir():
+            if os.path.isdir(path):
                 # Verify it's a valid Steam installation
-                if (path / "steam.sh").exists() or (path / "userdata").exists():
+                if os.path.exists(path / "steam.sh") or os.path.exists(path / "userdata"):
                     self.steam_path = path
                     return path
         
@@ -94,9 +122,9 @@ class GameDetector:
             pass
         
         for path in possible_paths:
-            if path.exists() and path.is_dir():
+            if os.path.isdir(path):
                 # Verify it's a valid Steam installation
-                if (path / "steam.exe").exists() or (path / "userdata").exists():
+                if os.path.exists(path / "steam.exe") or os.path.exists(path / "userdata"):
                     self.steam_path = path
                     return path
         
@@ -108,6 +136,9 @@ class GameDetector:
         Returns:
             Path to userdata directory or None if not found
         """
+        if self.userdata_path is not None:
+            return self.userdata_path
+        
         if self.steam_path is None:
             self.detect_steam_path()
         
@@ -115,7 +146,7 @@ class GameDetector:
             return None
         
         userdata = self.steam_path / "userdata"
-        if userdata.exists() and userdata.is_dir():
+        if os.path.isdir(userdata):
             self.userdata_path = userdata
             return userdata
         
@@ -133,12 +164,19 @@ class GameDetector:
         if self.userdata_path is None:
             return []
         
-        user_ids = []
-        for item in self.userdata_path.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                user_ids.append(item.name)
+        # Adding or removing a user directory bumps the userdata mtime
+        try:
+            mtime = os.stat(self.userdata_path).st_mtime_ns
+        except OSError:
+            return []
+        if mtime == self._user_ids_mtime:
+            return self.user_ids
+        
+        with os.scandir(self.userdata_path) as entries:
+            user_ids = [entry.name for entry in entries if entry.name.isdigit() and entry.is_dir()]
         
         self.user_ids = sorted(user_ids)
+        self._user_ids_mtime = mtime
         return self.user_ids
     
     def get_shortcuts_path(self, user_id: str) -> Optional[Path]:
@@ -157,7 +195,7 @@ class GameDetector:
             return None
         
         shortcuts_path = self.userdata_path / user_id / "config" / "shortcuts.vdf"
-        if shortcuts_path.exists():
+        if os.path.exists(shortcuts_path):
             return shortcuts_path
         
         return None
@@ -207,38 +245,56 @@ class GameDetector:
         games = []
         
         for custom_path in self.custom_paths:
-            if not custom_path.exists():
-                continue
-            
+            custom_path_str = str(custom_path)
             try:
                 # Look for game executables in subdirectories
-                for item in custom_path.iterdir():
-                    if not item.is_dir():
-                        continue
-                    
-                    # Look for .exe files (game executables)
-                    exe_files = list(item.glob("*.exe"))
-                    if not exe_files:
-                        continue
-                    
-                    # Use the first exe as the game executable
-                    game_exe = exe_files[0]
-                    
-                    game_info = {
-                        'name': item.name,
-                        'exe': str(game_exe),
-                        'start_dir': str(item),
-                        'app_id': None,
-                        'source': 'custom_directory',
-                        'custom_path': str(custom_path)
-                    }
-                    
-                    games.append(game_info)
+                with os.scandir(custom_path_str) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        
+                        # Use the first .exe file as the game executable
+                        game_exe = self._find_exe(entry.path)
+                        if game_exe is None:
+                            continue
+                        
+                        game_info = {
+                            'name': entry.name,
+                            'exe': game_exe,
+                            'start_dir': entry.path,
+                            'app_id': None,
+                            'source': 'custom_directory',
+                            'custom_path': custom_path_str
+                        }
+                        
+                        games.append(game_info)
+            except FileNotFoundError:
+                # Removed after the detector was created
+                continue
             except PermissionError:
                 print(f"Warning: Permission denied accessing {custom_path}")
         
         return games
     
+    def _find_exe(self, directory: str) -> Optional[str]:
+        """Find the first .exe file in a directory
+        
+        Args:
+            directory: Directory path to scan
+            
+        Returns:
+            Path string of the executable or None if not found (or unreadable)
+        """
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".exe"):
+                        return entry.path
+        except OSError:
+            # Unreadable or removed mid-scan: skip just this directory
+            return None
+        return None
+    
     def detect_save_locations(self, game_info: Dict[str, Any]) -> List[Path]:
         """Detect potential save locations for a game
         
@@ -366,265 +422,46 @@ class GameDetector:
             print(f"Error saving game config for {game_info['name']}: {e}")
             return False
     
-    def detect_all(self) -> dict:
-        """Run all detection steps and return summary
-        
-        Returns:
-            Dictionary with detection results
-        """
-        results = {
-            "steam_path": self.detect_steam_path(),
-            "userdata_path": self.detect_userdata_path(),
-            "user_ids": self.detect_user_ids(),
-            "shortcuts_files": [],
-            "non_steam_games": [],
-            "custom_games": []
-        }
-        
-        for user_id in self.user_ids:
-            shortcuts = self.get_shortcuts_path(user_id)
-            if shortcuts:
-                results["shortcuts_files"].append({
-                    "user_id": user_id,
-                    "path": shortcuts
-                })
-        
-        # Detect non-Steam games
-        results["non_steam_games"] = self.detect_non_steam_games()
-        
-        # Detect save locations for each game
-        for game in results["non_steam_games"]:
-            game['potential_save_locations'] = self.detect_save_locations(game)
-        
-        # Scan custom directories
-        results["custom_games"] = self.scan_custom_directories()
-        
-        # Detect save locations for custom games
-        for game in results["custom_games"]:
-            game['potential_save_locations'] = self.detect_save_locations(game)
-        
-        return results
-
-    
-    def detect_steam_path(self) -> Optional[Path]:
-        """Detect Steam installation path
-        
-        Returns:
-            Path to Steam installation or None if not found
-        """
-        if self.os_type == "linux":
-            return self._detect_steam_linux()
-        else:
-            return self._detect_steam_windows()
-    
-    def _detect_steam_linux(self) -> Optional[Path]:
-        """Detect Steam installation on Linux
-        
-        Returns:
-            Path to Steam installation or None if not found
-        """
-        # Common Steam paths on Linux
-        possible_paths = [
-            Path.home() / ".local" / "share" / "Steam",
-            Path.home() / ".steam" / "steam",
-            Path.home() / ".var" / "app" / "com.valvesoftware.Steam" / ".local" / "share" / "Steam",  # Flatpak
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                # Verify it's a valid Steam installation
-                if (path / "steam.sh").exists() or (path / "userdata").exists():
-                    self.steam_path = path
-                    return path
-        
-        return None
-    
-    def _detect_steam_windows(self) -> Optional[Path]:
-        """Detect Steam installation on Windows
-        
-        Returns:
-            Path to Steam installation or None if not found
-        """
-        # Common Steam paths on Windows
-        possible_paths = [
-            Path("C:/Program Files (x86)/Steam"),
-            Path("C:/Program Files/Steam"),
-        ]
-        
-        # Check registry-based paths (if available)
-        try:
-            import winreg
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                r"SOFTWARE\WOW6432Node\Valve\Steam")
-            install_path, _ = winreg.QueryValueEx(key, "InstallPath")
-            winreg.CloseKey(key)
-            possible_paths.insert(0, Path(install_path))
-        except:
-            pass
-        
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                # Verify it's a valid Steam installation
-                if (path / "steam.exe").exists() or (path / "userdata").exists():
-                    self.steam_path = path
-                    return path
-        
-        return None
-    
-    def detect_userdata_path(self) -> Optional[Path]:
-        """Detect Steam userdata directory
-        
-        Returns:
-            Path to userdata directory or None if not found
-        """
-        if self.steam_path is None:
-            self.detect_steam_path()
-        
-        if self.steam_path is None:
-            return None
-        
-        userdata = self.steam_path / "userdata"
-        if userdata.exists() and userdata.is_dir():
-            self.userdata_path = userdata
-            return userdata
-        
-        return None
-    
-    def detect_user_ids(self) -> List[str]:
-        """Detect Steam user IDs from userdata directory
-        
-        Returns:
-            List of user IDs (directory names in userdata)
-        """
-        if self.userdata_path is None:
-            self.detect_userdata_path()
-        
-        if self.userdata_path is None:
-            return []
-        
-        user_ids = []
-        for item in self.userdata_path.iterdir():
-            if item.is_dir() and item.name.isdigit():
-                user_ids.append(item.name)
-        
-        self.user_ids = sorted(user_ids)
-        return self.user_ids
-    
-    def get_shortcuts_path(self, user_id: str) -> Optional[Path]:
-        """Get path to shortcuts.vdf for a specific user
-        
-        Args:
-            user_id: Steam user ID
-            
-        Returns:
-            Path to shortcuts.vdf or None if not found
-        """
-        if self.userdata_path is None:
-            self.detect_userdata_path()
-        
-        if self.userdata_path is None:
-            return None
-        
-        shortcuts_path = self.userdata_path / user_id / "config" / "shortcuts.vdf"
-        if shortcuts_path.exists():
-            return shortcuts_path
-        
-        return None
-    
-    def detect_non_steam_games(self, user_id: str = None) -> List[Dict[str, Any]]:
-        """Detect non-Steam games from shortcuts.vdf
+    def _scan_signature(self, paths: List[Path]) -> Dict[Path, Optional[Tuple[int, int]]]:
+        """Stat tracked paths for change detection
         
         Args:
-            user_id: Specific user ID to check. If None, checks all users.
+            paths: Paths to stat
             
         Returns:
-            List of non-Steam game dictionaries
+            Dictionary mapping path to (st_mtime_ns, st_size), or None if missing
         """
-        if user_id:
-            user_ids = [user_id]
-        else:
-            user_ids = self.detect_user_ids()
-        
-        all_games = []
-        
-        for uid in user_ids:
-            shortcuts_path = self.get_shortcuts_path(uid)
-            if not shortcuts_path:
-                continue
-            
+        signature = {}
+        for path in paths:
             try:
-                parser = ShortcutsParser(shortcuts_path)
-                games = parser.parse()
-                
-                # Add user_id to each game
-                for game in games:
-                    game['user_id'] = uid
-                
-                all_games.extend(games)
-            except Exception as e:
-                # Log error but continue with other users
-                print(f"Warning: Failed to parse shortcuts for user {uid}: {e}")
-        
-        return all_games
+                stat = os.stat(path)
+                signature[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature[path] = None
+        return signature
     
-    def scan_custom_directories(self) -> List[Dict[str, Any]]:
-        """Scan custom directories for game installations
-        
-        Returns:
-            List of detected game dictionaries
-        """
-        games = []
+    def detect_all(self, force: bool = False) -> dict:
+        """Run all detection steps and return summary
         
-        for custom_path in self.custom_paths:
-            if not custom_path.exists():
-                continue
-            
-            try:
-                # Look for game executables in subdirectories
-                for item in custom_path.iterdir():
-                    if not item.is_dir():
-                        continue
-                    
-                    # Look for .exe files (game executables)
-                    exe_files = list(item.glob("*.exe"))
-                    if not exe_files:
-                        continue
-                    
-                    # Use the first exe as the game executable
-                    game_exe = exe_files[0]
-                    
-                    game_info = {
-                        'name': item.name,
-                        'exe': str(game_exe),
-                        'start_dir': str(item),
-                        'app_id': None,
-                        'source': 'custom_directory',
-                        'custom_path': str(custom_path)
-                    }
-                    
-                    games.append(game_info)
-            except PermissionError:
-                print(f"Warning: Permission denied accessing {custom_path}")
-        
-        return games
-    
-    def detect_save_locations(self, game_info: Dict[str, Any]) -> List[Path]:
-        """Detect potential save locations for a game
+        The result is cached together with the mtimes of the userdata
+        directory, each user's shortcuts.vdf and the custom paths. If none
+        of them changed since the previous call, a copy of the cached result
+        is returned without rescanning.
         
         Args:
-            game_info: Game information dictionary
+            force: Ignore the cached result and run a full scan
             
-        Returns:
-            List of potential save directories
-        """
-        return self.save_detector.find_save_directories(game_info, self.steam_path)
-    
-    def detect_all(self) -> dict:
-        """Run all detection steps and return summary
-        
         Returns:
             Dictionary with detection results
         """
+        if not force and self._last_scan_results is not None:
+            if self._scan_signature(list(self._last_scan_signature)) == self._last_scan_signature:
+                return copy.deepcopy(self._last_scan_results)
+        
+        # A full scan re-probes Steam if it was missing or a rescan was forced
+        if force or self.steam_path is None:
+            self.reset_detection()
+        
         results = {
             "steam_path": self.detect_steam_path(),
             "userdata_path": self.detect_userdata_path(),
@@ -656,4 +493,15 @@ class GameDetector:
         for game in results["custom_games"]:
             game['potential_save_locations'] = self.detect_save_locations(game)
         
+        # Only cache when Steam was found; otherwise there is nothing to watch
+        if self.userdata_path is not None:
+            tracked = [self.userdata_path]
+            tracked.extend(self.userdata_path / uid / "config" / "shortcuts.vdf" for uid in self.user_ids)
+            tracked.extend(self.custom_paths)
+            self._last_scan_signature = self._scan_signature(tracked)
+            self._last_scan_results = copy.deepcopy(results)
+        else:
+            self._last_scan_signature = {}
+            self._last_scan_results = None
+        
         return results
@@ -3,23 +3,103 @@ Logging module
 Handles application logging with file and console output
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
+class FastRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that avoids probing the file on every record
+    
+    RotatingFileHandler.shouldRollover() stats the log file and seeks to its
+    end for each record. This handler keeps a running count of the bytes
+    written and only runs the full check once the count nears maxBytes.
+    
+    Records below flush_level are left in the stream buffer instead of being
+    flushed one by one, so bursts of messages turn into a few large writes.
+    The owner is expected to call flush() once the burst is over.
+    """
+    
+    def __init__(self, *args, flush_level: int = logging.NOTSET, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._approx_size: Optional[int] = None
+        self.flush_level = flush_level
+        self._skip_flush = False
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check whether writing record would exceed maxBytes"""
+        if self.maxBytes <= 0:
+            return False
+        
+        if self._approx_size is None:
+            try:
+                self._approx_size = os.path.getsize(self.baseFilename)
+            except OSError:
+                self._approx_size = 0
+        
+        msg_len = len(self.format(record)) + 1
+        if self._approx_size + msg_len < self.maxBytes:
+            self._approx_size += msg_len
+            return False
+        
+        if super().shouldRollover(record):
+            return True
+        
+        # Estimate was off (e.g. file truncated externally), resync with the stream
+        if self.stream is not None:
+            self._approx_size = self.stream.tell() + msg_len
+        return False
+    
+    def doRollover(self):
+        """Rotate files and reset the size estimate"""
+        super().doRollover()
+        self._approx_size = 0
+    
+    def emit(self, record: logging.LogRecord):
+        """Write record, flushing only for records at or above flush_level"""
+        self._skip_flush = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+        finally:
+            self._skip_flush = False
+    
+    def flush(self):
+        """Flush the stream, unless called from emit() for a low-level record"""
+        self.acquire()
+        try:
+            if not self._skip_flush:
+                super().flush()
+        finally:
+            self.release()
+
+
+class FlushingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers whenever the queue runs dry"""
+    
+    def dequeue(self, block: bool):
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+
 class Logger:
     """Application logger with file and console output"""
     
-    def __init__(self, log_dir: Path, log_level: str = "info", verbose: bool = False):
+    def __init__(self, log_dir: Path, log_level: str = "info", verbose: bool = False,
+                 console: bool = True):
         """Initialize logger
         
         Args:
             log_dir: Directory for log files
             log_level: Log level (debug, info, warning, error)
             verbose: Enable verbose console output
+            console: Attach a console handler (False for full-screen UIs that own stdout)
         """
         self.log_dir = Path(log_dir)
         self.log_file = self.log_dir / "gamesync.log"
@@ -33,13 +113,15 @@ class Logger:
         self.logger = logging.getLogger("gamesync")
         self.logger.setLevel(logging.DEBUG)  # Capture all levels
         self.logger.handlers.clear()  # Clear any existing handlers
+        self.logger.propagate = False  # Don't pass records on to root logger handlers
         
         # File handler with rotation (10MB max, keep 5 backups)
-        file_handler = RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             self.log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            flush_level=logging.ERROR  # Errors hit the disk right away
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
@@ -47,15 +129,39 @@ class Logger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self.file_handler = file_handler
+        
+        # File writes happen on a background listener thread; callers only
+        # pay for a queue put. The listener flushes once the queue is drained
+        # and again in close(), which also runs at exit.
+        self._queue = queue.SimpleQueue()
+        self._listener: Optional[QueueListener] = FlushingQueueListener(
+            self._queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
         
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_level = logging.DEBUG if verbose else self.log_level
-        console_handler.setLevel(console_level)
-        console_formatter = logging.Formatter('%(message)s')
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        queue_handler = QueueHandler(self._queue)
+        queue_handler.setLevel(logging.DEBUG)
+        self.logger.addHandler(queue_handler)
+        
+        # Console handler (kept synchronous so output stays ordered with print())
+        if console:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_level = logging.DEBUG if verbose else self.log_level
+            console_handler.setLevel(console_level)
+            console_formatter = logging.Formatter('%(message)s')
+            console_handler.setFormatter(console_formatter)
+            self.logger.addHandler(console_handler)
+    
+    def close(self):
+        """Flush pending file writes and release the log file"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        self.file_handler.close()
+        atexit.unregister(self.close)
     
     def _parse_level(self, level: str) -> int:
         """Parse log level string to logging constant
@@ -99,19 +205,23 @@ class Logger:
 _logger: Optional[Logger] = None
 
 
-def init_logger(log_dir: Path, log_level: str = "info", verbose: bool = False) -> Logger:
+def init_logger(log_dir: Path, log_level: str = "info", verbose: bool = False,
+                console: bool = True) -> Logger:
     """Initialize global logger
     
     Args:
         log_dir: Directory for log files
         log_level: Log level (debug, info, warning, error)
         verbose: Enable verbose console output
+        console: Attach a console handler
         
     Returns:
         Logger instance
     """
     global _logger
-    _logger = Logger(log_dir, log_level, verbose)
+    if _logger is not None:
+        _logger.close()
+    _logger = Logger(log_dir, log_level, verbose, console)
     return _logger
 
 
@@ -5,13 +5,53 @@ Heuristics for finding game save directories
 
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+
+# System directories that never contain game saves
+SKIP_DIRS = frozenset({'Microsoft', 'Temp', 'temp', 'Cache', 'cache', '__pycache__'})
+
+# File name patterns that identify save files
+SAVE_EXTENSIONS = ('.sav', '.dat', '.save', '.bin', '.slot')
+SAVE_KEYWORDS = ('save', 'saves', 'savegame', 'savegames', 'savedata', 'saved')
+SAVE_KEYWORD_RE = re.compile('|'.join(map(re.escape, SAVE_KEYWORDS)))
+
+# Save roots inside a Proton prefix's users/steamuser directory, grouped by
+# top-level folder so missing folders are skipped without probing each root
+PROTON_SAVE_LAYOUT = (
+    ("AppData", (("Local",), ("Roaming",), ("LocalLow",))),
+    ("Documents", ((), ("My Games",))),
+    ("Saved Games", ((),)),
+)
+
+# Characters stripped from game names before directory matching
+CLEAN_NAME_RE = re.compile(r'[^\w\s-]')
 
 
 class SaveLocationDetector:
     """Detects game save file locations"""
     
+    # find_save_directories() results are reused for this many seconds
+    CACHE_TTL = 60.0
+    CACHE_MAX_ENTRIES = 256
+    
+    # Shared worker pool for directory scans, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared scan thread pool"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="save-scan")
+            return cls._executor
+    
     def __init__(self, os_type: str):
         """Initialize save location detector
         
@@ -19,6 +59,35 @@ class SaveLocationDetector:
             os_type: Operating system type ("linux" or "windows")
         """
         self.os_type = os_type
+        self._save_dir_cache: Dict[Tuple, Tuple[float, List[Path]]] = {}
+    
+    def clear_cache(self):
+        """Forget memoized find_save_directories() results"""
+        self._save_dir_cache.clear()
+    
+    @cached_property
+    def _home(self) -> Path:
+        """User home directory, resolved once per detector"""
+        return Path.home()
+    
+    @cached_property
+    def _windows_env_map(self) -> List[Tuple[str, str]]:
+        """Windows folder placeholders and their expansions"""
+        home = str(self._home)
+        return [
+            ("%USERPROFILE%", home),
+            ("%APPDATA%", os.path.join(home, "AppData", "Roaming")),
+            ("%LOCALAPPDATA%", os.path.join(home, "AppData", "Local")),
+            ("%DOCUMENTS%", os.path.join(home, "Documents")),
+        ]
+    
+    @cached_property
+    def _common_save_locations(self) -> List[str]:
+        """Existing common save locations, probed once per detector"""
+        if self.os_type == "linux":
+            return self._get_linux_save_locations()
+        else:
+            return self._get_windows_save_locations()
     
     def expand_path(self, path: str) -> Path:
         """Expand environment variables and user paths
@@ -36,11 +105,9 @@ class SaveLocationDetector:
         path = os.path.expanduser(path)
         
         # Windows-specific expansions
-        if self.os_type == "windows":
-            path = path.replace("%USERPROFILE%", str(Path.home()))
-            path = path.replace("%APPDATA%", str(Path.home() / "AppData" / "Roaming"))
-            path = path.replace("%LOCALAPPDATA%", str(Path.home() / "AppData" / "Local"))
-            path = path.replace("%DOCUMENTS%", str(Path.home() / "Documents"))
+        if self.os_type == "windows" and "%" in path:
+            for token, value in self._windows_env_map:
+                path = path.replace(token, value)
         
         return Path(path)
     
@@ -50,60 +117,71 @@ class SaveLocationDetector:
         Returns:
             List of common save directories
         """
-        if self.os_type == "linux":
-            return self._get_linux_save_locations()
-        else:
-            return self._get_windows_save_locations()
+        return [Path(loc) for loc in self._common_save_locations]
     
-    def _get_linux_save_locations(self) -> List[Path]:
+    def _get_linux_save_locations(self) -> List[str]:
         """Get common Linux save locations
         
         Returns:
-            List of directories
+            List of directory path strings
         """
-        home = Path.home()
+        home = str(self._home)
         locations = [
-            home / ".local" / "share",
-            home / ".config",
-            home / "Documents",
-            home / "Documents" / "My Games",
+            os.path.join(home, ".local", "share"),
+            os.path.join(home, ".config"),
+            os.path.join(home, "Documents"),
+            os.path.join(home, "Documents", "My Games"),
         ]
         
         # XDG directories
         xdg_data = os.environ.get("XDG_DATA_HOME")
         if xdg_data:
-            locations.append(Path(xdg_data))
+            locations.append(xdg_data)
         
         xdg_config = os.environ.get("XDG_CONFIG_HOME")
         if xdg_config:
-            locations.append(Path(xdg_config))
+            locations.append(xdg_config)
         
-        return [loc for loc in locations if loc.exists()]
+        return [loc for loc in locations if os.path.isdir(loc)]
     
-    def _get_windows_save_locations(self) -> List[Path]:
+    def _get_windows_save_locations(self) -> List[str]:
         """Get common Windows save locations
         
         Returns:
-            List of directories
+            List of directory path strings
         """
-        home = Path.home()
+        home = str(self._home)
         locations = [
-            home / "Documents",
-            home / "Documents" / "My Games",
-            home / "Saved Games",
-            home / "AppData" / "Roaming",
-            home / "AppData" / "Local",
-            home / "AppData" / "LocalLow",
+            os.path.join(home, "Documents"),
+            os.path.join(home, "Documents", "My Games"),
+            os.path.join(home, "Saved Games"),
+            os.path.join(home, "AppData", "Roaming"),
+            os.path.join(home, "AppData", "Local"),
+            os.path.join(home, "AppData", "LocalLow"),
         ]
         
-        return [loc for loc in locations if loc.exists()]
+        return [loc for loc in locations if os.path.isdir(loc)]
     
-    def check_proton_prefix(self, game_info: Dict[str, Any], steam_path: Path) -> Optional[Path]:
+    def _get_start_path(self, game_info: Dict[str, Any]) -> Optional[Path]:
+        """Parse the game's start directory
+        
+        Args:
+            game_info: Game information dictionary
+            
+        Returns:
+            Start directory as Path, or None if not set
+        """
+        start_dir = game_info.get('start_dir', '')
+        return Path(start_dir) if start_dir else None
+    
+    def check_proton_prefix(self, game_info: Dict[str, Any], steam_path: Path,
+                            start_path: Optional[Path] = None) -> Optional[Path]:
         """Check for Proton/Wine prefix save locations
         
         Args:
             game_info: Game information dictionary
             steam_path: Steam installation path
+            start_path: Parsed start directory (parsed from game_info if None)
             
         Returns:
             Proton prefix path or None
@@ -117,50 +195,103 @@ class SaveLocationDetector:
         
         # For non-Steam games, the app_id is very large (> 2^32)
         # We need to check compatdata directory
-        compatdata = steam_path / "steamapps" / "compatdata" / str(app_id)
-        if compatdata.exists():
-            prefix = compatdata / "pfx" / "drive_c"
-            if prefix.exists():
-                return prefix
+        if steam_path is not None:
+            compatdata = os.path.join(steam_path, "steamapps", "compatdata", str(app_id))
+            if os.path.isdir(compatdata):
+                prefix = os.path.join(compatdata, "pfx", "drive_c")
+                if os.path.isdir(prefix):
+                    return Path(prefix)
         
         # Also check if the game is using a custom prefix path
         # Sometimes non-Steam games use the start_dir as a hint
-        start_dir = game_info.get('start_dir', '')
-        if start_dir and 'drive_c' in start_dir:
+        if start_path is None:
+            start_path = self._get_start_path(game_info)
+        if start_path is not None and 'drive_c' in start_path.parts:
             # Extract the prefix path
-            parts = Path(start_dir).parts
-            try:
-                drive_c_index = parts.index('drive_c')
-                prefix_path = Path(*parts[:drive_c_index]) / 'drive_c'
-                if prefix_path.exists():
-                    return prefix_path
-            except (ValueError, IndexError):
-                pass
+            parts = start_path.parts
+            prefix_path = Path(*parts[:parts.index('drive_c') + 1])
+            if os.path.isdir(prefix_path):
+                return prefix_path
         
         return None
     
-    def check_game_directory(self, game_info: Dict[str, Any]) -> Optional[Path]:
+    def _get_proton_save_locations(self, proton_prefix: Path) -> List[str]:
+        """Get Windows save locations that exist inside a Proton prefix
+        
+        Args:
+            proton_prefix: Prefix drive_c directory
+            
+        Returns:
+            List of directory path strings, in priority order
+        """
+        steamuser = os.path.join(proton_prefix, "users", "steamuser")
+        try:
+            with os.scandir(steamuser) as entries:
+                children = {entry.name: entry.path for entry in entries if entry.is_dir()}
+        except OSError:
+            return []
+        
+        locations = []
+        for top_level, subpaths in PROTON_SAVE_LAYOUT:
+            top_path = children.get(top_level)
+            if top_path:
+                locations.extend(os.path.join(top_path, *subpath) for subpath in subpaths)
+        return locations
+    
+    def check_game_directory(self, game_info: Dict[str, Any],
+                             start_path: Optional[Path] = None) -> Optional[Path]:
         """Check game installation directory for saves
         
         Args:
             game_info: Game information dictionary
+            start_path: Parsed start directory (parsed from game_info if None)
             
         Returns:
             Game directory or None
         """
-        start_dir = game_info.get('start_dir', '')
-        if not start_dir:
-            return None
+        if start_path is None:
+            start_path = self._get_start_path(game_info)
         
-        game_dir = Path(start_dir)
-        if game_dir.exists():
-            return game_dir
+        if start_path is not None and os.path.isdir(start_path):
+            return start_path
         
         return None
     
     def find_save_directories(self, game_info: Dict[str, Any], steam_path: Path = None) -> List[Path]:
         """Find potential save directories for a game
         
+        Results are memoized per (name, app_id, start_dir, steam_path) for
+        CACHE_TTL seconds; call clear_cache() to force a fresh scan.
+        
+        Args:
+            game_info: Game information dictionary
+            steam_path: Steam installation path (optional)
+            
+        Returns:
+            List of potential save directories
+        """
+        key = (
+            game_info.get('name', ''),
+            game_info.get('app_id'),
+            game_info.get('start_dir', ''),
+            str(steam_path) if steam_path else None,
+        )
+        now = time.monotonic()
+        cached = self._save_dir_cache.get(key)
+        if cached is not None and now - cached[0] < self.CACHE_TTL:
+            return list(cached[1])
+        
+        result = self._find_save_directories(game_info, steam_path)
+        
+        if key not in self._save_dir_cache and len(self._save_dir_cache) >= self.CACHE_MAX_ENTRIES:
+            # Drop the oldest entry
+            del self._save_dir_cache[next(iter(self._save_dir_cache))]
+        self._save_dir_cache[key] = (now, result)
+        return list(result)
+    
+    def _find_save_directories(self, game_info: Dict[str, Any], steam_path: Optional[Path]) -> List[Path]:
+        """Uncached implementation of find_save_directories
+        
         Args:
             game_info: Game information dictionary
             steam_path: Steam installation path (optional)
@@ -174,44 +305,60 @@ class SaveLocationDetector:
         # Clean game name for directory matching
         clean_name = self._clean_game_name(game_name)
         
+        # Parse start_dir once for both prefix and game directory checks
+        start_path = self._get_start_path(game_info)
+        
         # Check Proton prefix (Linux only) - PRIORITY for non-Steam games
         if self.os_type == "linux":
-            proton_prefix = self.check_proton_prefix(game_info, steam_path)
+            proton_prefix = self.check_proton_prefix(game_info, steam_path, start_path)
             if proton_prefix:
                 # Check common Windows save locations in prefix
-                prefix_locations = [
-                    proton_prefix / "users" / "steamuser" / "AppData" / "Local",
-                    proton_prefix / "users" / "steamuser" / "AppData" / "Roaming",
-                    proton_prefix / "users" / "steamuser" / "AppData" / "LocalLow",
-                    proton_prefix / "users" / "steamuser" / "Documents",
-                    proton_prefix / "users" / "steamuser" / "Documents" / "My Games",
-                    proton_prefix / "users" / "steamuser" / "Saved Games",
-                ]
+                prefix_locations = self._get_proton_save_locations(proton_prefix)
                 
-                for loc in prefix_locations:
-                    if loc.exists():
-                        # Look for game-specific subdirectories
-                        game_subdirs = self._find_game_subdirs(loc, clean_name)
-                        if game_subdirs:
-                            candidates.extend(game_subdirs)
+                # Look for game-specific subdirectories
+                candidates.extend(self._scan_locations(prefix_locations, clean_name))
         
         # Check game installation directory
-        game_dir = self.check_game_directory(game_info)
+        game_dir = self.check_game_directory(game_info, start_path)
         if game_dir:
             # Look for save-related subdirectories
             save_dirs = ['save', 'saves', 'savegame', 'savegames', 'SaveData', 'Saves']
+            game_dir_str = str(game_dir)
             for save_dir in save_dirs:
-                potential = game_dir / save_dir
-                if potential.exists():
-                    candidates.append(potential)
+                potential = os.path.join(game_dir_str, save_dir)
+                if os.path.isdir(potential):
+                    candidates.append(Path(potential))
         
         # Check common OS save locations (lower priority for Proton games)
         if not candidates or self.os_type != "linux":
-            for base_loc in self.get_common_save_locations():
-                candidates.extend(self._find_game_subdirs(base_loc, clean_name))
+            candidates.extend(self._scan_locations(self._common_save_locations, clean_name))
+        
+        # Remove duplicates, keeping the first (highest priority) occurrence
+        unique = {}
+        for candidate in candidates:
+            unique.setdefault(os.path.normpath(candidate), candidate)
+        return list(unique.values())
+    
+    def _scan_locations(self, locations: List[str], game_name: str) -> List[Path]:
+        """Search several base locations for game directories concurrently
         
-        # Remove duplicates and return
-        return list(set(candidates))    
+        The scans are I/O bound, so running them on worker threads overlaps
+        the filesystem latency of independent trees.
+        
+        Args:
+            locations: Base directories to search
+            game_name: Game name to match
+            
+        Returns:
+            Matching directories, in the order of locations
+        """
+        if len(locations) <= 1:
+            return [match for loc in locations for match in self._find_game_subdirs(loc, game_name)]
+        
+        executor = self._get_executor()
+        results = executor.map(lambda loc: self._find_game_subdirs(loc, game_name), locations)
+        return [match for matches in results for match in matches]
+    
     def _clean_game_name(self, name: str) -> str:
         """Clean game name for directory matching
         
@@ -221,13 +368,17 @@ class SaveLocationDetector:
         Returns:
             Cleaned name
         """
+        # Fast path: only letters, digits, spaces, '-' and '_', nothing to strip
+        if name.replace(' ', '').replace('-', '').replace('_', '').isalnum():
+            return ' '.join(name.split())
+        
         # Remove special characters, keep alphanumeric and spaces
-        clean = re.sub(r'[^\w\s-]', '', name)
+        clean = CLEAN_NAME_RE.sub('', name)
         # Remove extra whitespace
         clean = ' '.join(clean.split())
         return clean
     
-    def _find_game_subdirs(self, base_path: Path, game_name: str, max_depth: int = 3) -> List[Path]:
+    def _find_game_subdirs(self, base_path: Union[str, Path], game_name: str, max_depth: int = 3) -> List[Path]:
         """Find subdirectories matching game name
         
         Args:
@@ -238,7 +389,7 @@ class SaveLocationDetector:
         Returns:
             List of matching directories
         """
-        if not base_path.exists():
+        if not os.path.isdir(base_path):
             return []
         
         matches = []
@@ -252,52 +403,49 @@ class SaveLocationDetector:
             game_name_lower.replace(' ', '-'),
             game_name_lower.replace("'", ''),
         ]
+        game_variations = [v for v in game_variations if v]
         
-        def search_recursive(path: Path, depth: int = 0):
+        # A directory matches if it contains any variation or significant word,
+        # or if its name is contained in a variation. NUL never occurs in file
+        # names, so joining on it keeps the reverse check per-variation.
+        needles = game_variations + game_words
+        pattern = re.compile('|'.join(map(re.escape, needles))) if needles else None
+        joined_variations = '\0'.join(game_variations)
+        
+        def search_recursive(path: str, depth: int = 0):
             if depth > max_depth:
                 return
             
             try:
-                for item in path.iterdir():
-                    if not item.is_dir():
-                        continue
-                    
-                    # Skip system directories
-                    if item.name in ['Microsoft', 'Temp', 'temp', 'Cache', 'cache']:
-                        continue
-                    
-                    item_name_lower = item.name.lower()
-                    
-                    # Check exact or partial matches with variations
-                    matched = False
-                    for variation in game_variations:
-                        if variation and (variation in item_name_lower or item_name_lower in variation):
-                            matched = True
-                            break
-                    
-                    # Also check if any significant word from game name is in directory name
-                    if not matched and game_words:
-                        for word in game_words:
-                            if word in item_name_lower:
-                                matched = True
-                                break
-                    
-                    if matched:
-                        # Check if this directory or subdirectories contain saves
-                        save_dirs = self._find_save_subdirs(item)
-                        if save_dirs:
-                            matches.extend(save_dirs)
-                        else:
-                            # Add the directory itself if no specific save subdirs found
-                            matches.append(item)
+                with os.scandir(path) as entries:
+                    subdirs = [entry for entry in entries if entry.is_dir()]
+            except OSError:
+                return
+            
+            for entry in subdirs:
+                # Skip system directories
+                if entry.name in SKIP_DIRS:
+                    continue
+                
+                item_name_lower = entry.name.lower()
+                matched = item_name_lower in joined_variations or (
+                    pattern is not None and pattern.search(item_name_lower) is not None
+                )
+                
+                if matched:
+                    # Check if this directory or subdirectories contain saves
+                    save_dirs = self._scan_save_subdirs(entry.path)
+                    if save_dirs:
+                        matches.extend(save_dirs)
                     else:
-                        # Continue searching deeper
-                        search_recursive(item, depth + 1)
-            except PermissionError:
-                pass
-        
-        search_recursive(base_path)
-        return matches
+                        # Add the directory itself if no specific save subdirs found
+                        matches.append(entry.path)
+                else:
+                    # Continue searching deeper
+                    search_recursive(entry.path, depth + 1)
+        
+        search_recursive(str(base_path))
+        return [Path(match) for match in matches]
     
     def _find_save_subdirs(self, game_dir: Path, max_depth: int = 3) -> List[Path]:
         """Find subdirectories containing actual save files
@@ -309,54 +457,68 @@ class SaveLocationDetector:
         Returns:
             List of directories containing save files (prefers parent dirs with most files)
         """
+        return [Path(p) for p in self._scan_save_subdirs(os.path.normpath(game_dir), max_depth)]
+    
+    def _scan_save_subdirs(self, game_dir: str, max_depth: int = 3) -> List[str]:
+        """String-path implementation of _find_save_subdirs
+        
+        Args:
+            game_dir: Normalized game directory path
+            max_depth: Maximum depth to search for save files
+            
+        Returns:
+            List of directory path strings containing save files
+        """
         save_dirs = {}  # path -> file count
-        save_extensions = ['.sav', '.dat', '.save', '.bin', '.slot']
-        save_keywords = ['save', 'saves', 'savegame', 'savegames', 'savedata', 'saved']
         
-        def search_for_saves(path: Path, depth: int = 0):
+        # Iterative depth-first walk; each stack item is (directory, depth)
+        stack = [(game_dir, 0)]
+        while stack:
+            path, depth = stack.pop()
             if depth > max_depth:
-                return
+                continue
             
             try:
-                has_save_files = False
-                save_file_count = 0
-                
-                for item in path.iterdir():
-                    if item.is_file():
-                        # Check if it's a save file by extension or name
-                        if any(item.name.lower().endswith(ext) for ext in save_extensions):
-                            has_save_files = True
-                            save_file_count += 1
-                        elif any(kw in item.name.lower() for kw in save_keywords):
-                            has_save_files = True
-                            save_file_count += 1
-                    elif item.is_dir():
-                        # Skip system directories
-                        if item.name not in ['Microsoft', 'Temp', 'temp', 'Cache', 'cache', '__pycache__']:
-                            search_for_saves(item, depth + 1)
-                
-                if has_save_files:
-                    save_dirs[path] = save_file_count
-                    
-            except PermissionError:
-                pass
-        
-        search_for_saves(game_dir)
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            save_file_count = 0
+            
+            for entry in entries:
+                # is_file()/is_dir() answer from the readdir d_type; only symlinks
+                # cost a stat, and they are followed so linked saves still count
+                if entry.is_file():
+                    # Check if it's a save file by extension or name
+                    name_lower = entry.name.lower()
+                    if name_lower.endswith(SAVE_EXTENSIONS):
+                        save_file_count += 1
+                    elif SAVE_KEYWORD_RE.search(name_lower):
+                        save_file_count += 1
+                elif entry.is_dir():
+                    # Skip system directories
+                    if entry.name not in SKIP_DIRS:
+                        stack.append((entry.path, depth + 1))
+            
+            if save_file_count:
+                save_dirs[path] = save_file_count
         
         # Return only parent directories (avoid returning both parent and child)
         if save_dirs:
             # Sort by file count descending
             sorted_dirs = sorted(save_dirs.items(), key=lambda x: x[1], reverse=True)
             
-            # Keep only the shallowest directory in each hierarchy
+            # Keep only the shallowest directory in each hierarchy: walk up
+            # from each path to game_dir and drop it if an ancestor has saves
             result = []
             for path, count in sorted_dirs:
-                # Check if any existing result is a parent of this path
-                has_parent = any(p in path.parents for p in result)
-                
-                if not has_parent:
-                    # Remove any children of this path from results
-                    result = [p for p in result if path not in p.parents]
+                parent = path
+                while len(parent) > len(game_dir):
+                    parent = os.path.dirname(parent)
+                    if parent in save_dirs:
+                        break
+                else:
                     result.append(path)
             
             return result
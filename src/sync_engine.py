@@ -3,13 +3,32 @@ Sync engine module
 Handles file synchronization between local and cloud
 """
 
+import errno
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from enum import Enum
 
+from .fast_stat import fast_stat
+
+
+# Bytes requested per os.copy_file_range call
+COPY_CHUNK_SIZE = 1 << 30
+
+# Bytes read per step when checking if a destination is already up to date
+COMPARE_CHUNK_SIZE = 1 << 20
+
+# Cloud listings with at least this many files are stat'ed from a thread pool
+STAT_BATCH_MIN = 32
+
+# copy_file_range errors meaning "not possible here", use a regular copy instead
+COPY_RANGE_FALLBACK_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.EPERM
+})
+
 
 class SyncAction(Enum):
     """Sync action types"""
@@ -22,13 +41,22 @@ class SyncAction(Enum):
 class FileComparison:
     """Represents a file comparison result"""
     
-    def __init__(self, filename: str, local_path: Optional[Path], cloud_path: Optional[Path]):
+    # Fixed attribute layout: one instance per file in every comparison
+    __slots__ = ('filename', 'local_path', 'cloud_path', 'action',
+                 'local_mtime', 'cloud_mtime', 'local_size', 'cloud_size',
+                 'local_stat', 'cloud_stat')
+    
+    def __init__(self, filename: str, local_path: Optional[Path], cloud_path: Optional[Path],
+                 local_stat: Optional[os.stat_result] = None,
+                 cloud_stat: Optional[os.stat_result] = None):
         """Initialize file comparison
         
         Args:
             filename: Name of the file
             local_path: Path to local file (None if doesn't exist)
             cloud_path: Path to cloud file (None if doesn't exist)
+            local_stat: Already known stat of the local file (stats local_path if omitted)
+            cloud_stat: Already known stat of the cloud file (stats cloud_path if omitted)
         """
         self.filename = filename
         self.local_path = local_path
@@ -39,16 +67,27 @@ class FileComparison:
         self.local_size: Optional[int] = None
         self.cloud_size: Optional[int] = None
         
-        # Get file stats
-        if local_path and local_path.exists():
-            stat = local_path.stat()
-            self.local_mtime = stat.st_mtime
-            self.local_size = stat.st_size
+        # Get file stats (None if the file doesn't exist)
+        self.local_stat = local_stat if local_stat is not None else self._stat(local_path)
+        self.cloud_stat = cloud_stat if cloud_stat is not None else self._stat(cloud_path, fast_stat)
+        
+        if self.local_stat is not None:
+            self.local_mtime = self.local_stat.st_mtime
+            self.local_size = self.local_stat.st_size
         
-        if cloud_path and cloud_path.exists():
-            stat = cloud_path.stat()
-            self.cloud_mtime = stat.st_mtime
-            self.cloud_size = stat.st_size
+        if self.cloud_stat is not None:
+            self.cloud_mtime = self.cloud_stat.st_mtime
+            self.cloud_size = self.cloud_stat.st_size
+    
+    @staticmethod
+    def _stat(path: Optional[Path], stat_func=os.stat) -> Optional[os.stat_result]:
+        """Stat path, returning None if it is unset or missing"""
+        if path is None:
+            return None
+        try:
+            return stat_func(path)
+        except OSError:
+            return None
     
     def __repr__(self):
         return f"FileComparison({self.filename}, action={self.action.value})"
@@ -57,69 +96,271 @@ class FileComparison:
 class SyncEngine:
     """Handles file synchronization operations"""
     
+    MAX_COPY_WORKERS = 8  # Concurrent file copies in sync_files
+    MAX_STAT_WORKERS = 16  # Concurrent cloud-side stats in _get_files
+    
+    # SyncAction -> key used in get_sync_summary
+    SUMMARY_KEYS = {
+        SyncAction.COPY_TO_CLOUD: "copy_to_cloud",
+        SyncAction.COPY_TO_LOCAL: "copy_to_local",
+        SyncAction.CONFLICT: "conflicts",
+        SyncAction.SKIP: "skip"
+    }
+    
     def __init__(self):
         """Initialize sync engine"""
-        pass
+        # (local_dir, cloud_dir) -> (last_sync, stat signature, comparisons)
+        self._compare_cache: Dict[Tuple[str, str], Tuple[Union[str, float, None], Tuple[frozenset, frozenset], List[FileComparison]]] = {}
+        # Destination directory -> mode given to copied files
+        self._dir_mode_cache: Dict[Path, int] = {}
+        # Destination directories created up front by the current sync_files run
+        self._ready_dirs: set = set()
+        # Most recent (last_sync, parsed timestamp)
+        self._last_sync_cache: Optional[Tuple[Union[str, float], Optional[float]]] = None
+        # Worker that lists the cloud side while the local side is listed, created on first use
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
     
-    def compare_directories(self, local_dir: Path, cloud_dir: Path, last_sync: Optional[str] = None) -> List[FileComparison]:
+    def compare_directories(self, local_dir: Path, cloud_dir: Path, last_sync: Union[str, float, None] = None) -> List[FileComparison]:
         """Compare files in local and cloud directories
         
         Args:
             local_dir: Local directory path
             cloud_dir: Cloud directory path
-            last_sync: ISO format timestamp of last sync (optional)
+            last_sync: ISO format string or POSIX timestamp of last sync (optional)
             
         Returns:
             List of FileComparison objects
         """
+        # Get all files from both directories
+        local_files, cloud_files = self._list_both(local_dir, cloud_dir)
+        
+        # Nothing changed since the last call: reuse its result
+        cache_key = (str(local_dir), str(cloud_dir))
+        signature = (self._stat_signature(local_files), self._stat_signature(cloud_files))
+        cached = self._compare_cache.get(cache_key)
+        if cached is not None and cached[0] == last_sync and cached[1] == signature:
+            return list(cached[2])
+        
+        # One side empty (first sync): every file is copied across, already in order
+        if not cloud_files or not local_files:
+            comparisons = self._one_sided_comparisons(local_dir, cloud_dir, local_files, cloud_files)
+            self._compare_cache[cache_key] = (last_sync, signature, comparisons)
+            return list(comparisons)
+        
         comparisons = []
         
         # Convert last_sync to timestamp
-        last_sync_time = None
-        if last_sync:
-            try:
-                dt = datetime.fromisoformat(last_sync)
-                last_sync_time = dt.timestamp()
-            except:
-                pass
+        last_sync_time = self._parse_last_sync(last_sync)
         
-        # Get all files from both directories
-        local_files = self._get_files(local_dir) if local_dir.exists() else set()
-        cloud_files = self._get_files(cloud_dir) if cloud_dir.exists() else set()
-        all_files = local_files | cloud_files
+        # Files on one side only always get copied to the other side
+        for filename in local_files.keys() - cloud_files.keys():
+            comparison = FileComparison(filename, local_dir / filename, None, local_stat=local_files[filename])
+            comparison.action = SyncAction.COPY_TO_CLOUD
+            comparisons.append(comparison)
         
-        for filename in sorted(all_files):
-            local_path = local_dir / filename if filename in local_files else None
-            cloud_path = cloud_dir / filename if filename in cloud_files else None
-            
-            comparison = FileComparison(filename, local_path, cloud_path)
+        for filename in cloud_files.keys() - local_files.keys():
+            comparison = FileComparison(filename, None, cloud_dir / filename, cloud_stat=cloud_files[filename])
+            comparison.action = SyncAction.COPY_TO_LOCAL
+            comparisons.append(comparison)
+        
+        # Files on both sides need their timestamps compared
+        for filename in local_files.keys() & cloud_files.keys():
+            comparison = FileComparison(filename, local_dir / filename, cloud_dir / filename,
+                                        local_files[filename], cloud_files[filename])
             comparison.action = self._determine_action(comparison, last_sync_time)
             comparisons.append(comparison)
         
+        comparisons.sort(key=lambda c: c.filename)
+        
+        self._compare_cache[cache_key] = (last_sync, signature, comparisons)
+        return list(comparisons)
+    
+    @staticmethod
+    def _one_sided_comparisons(local_dir: Path, cloud_dir: Path,
+                               local_files: Dict[str, os.stat_result],
+                               cloud_files: Dict[str, os.stat_result]) -> List[FileComparison]:
+        """Build comparisons when at most one directory has files
+        
+        Skips the set arithmetic, timestamp parsing and final sort of the
+        general case.
+        
+        Args:
+            local_dir: Local directory path
+            cloud_dir: Cloud directory path
+            local_files: Local {filename: stat_result} map
+            cloud_files: Cloud {filename: stat_result} map (empty if local_files is not)
+            
+        Returns:
+            List of FileComparison objects sorted by filename
+        """
+        comparisons = []
+        for filename in sorted(local_files):
+            comparison = FileComparison(filename, local_dir / filename, None, local_stat=local_files[filename])
+            comparison.action = SyncAction.COPY_TO_CLOUD
+            comparisons.append(comparison)
+        
+        for filename in sorted(cloud_files):
+            comparison = FileComparison(filename, None, cloud_dir / filename, cloud_stat=cloud_files[filename])
+            comparison.action = SyncAction.COPY_TO_LOCAL
+            comparisons.append(comparison)
+        
         return comparisons
     
-    def _get_files(self, directory: Path) -> set:
+    def _parse_last_sync(self, last_sync: Union[str, float, None]) -> Optional[float]:
+        """Convert last_sync to a timestamp
+        
+        Numbers are already POSIX timestamps and are used as-is. The most
+        recent ISO string conversion is cached, since callers pass the same
+        value on every call until a sync completes.
+        
+        Args:
+            last_sync: ISO format string or POSIX timestamp of last sync (optional)
+            
+        Returns:
+            POSIX timestamp, or None if last_sync is unset or invalid
+        """
+        if not last_sync:
+            return None
+        
+        if isinstance(last_sync, (int, float)):
+            return float(last_sync)
+        
+        if self._last_sync_cache is not None and self._last_sync_cache[0] == last_sync:
+            return self._last_sync_cache[1]
+        
+        try:
+            last_sync_time = datetime.fromisoformat(last_sync).timestamp()
+        except (ValueError, TypeError, OverflowError, OSError):
+            last_sync_time = None
+        
+        self._last_sync_cache = (last_sync, last_sync_time)
+        return last_sync_time
+    
+    @staticmethod
+    def _stat_signature(files: Dict[str, os.stat_result]) -> frozenset:
+        """Summarize a directory listing by file name, mtime and size
+        
+        Args:
+            files: Filename to stat result mapping from _get_files
+            
+        Returns:
+            Frozenset that compares equal while no file was added, removed or modified
+        """
+        return frozenset((name, st.st_mtime_ns, st.st_size) for name, st in files.items())
+    
+    def has_changes(self, local_dir: Path, cloud_dir: Path, last_sync: Union[str, float, None] = None) -> bool:
+        """Quick check whether local and cloud directories need syncing
+        
+        Cheaper than compare_directories for callers that only need a yes/no
+        answer: the two listings are compared directly, without building
+        FileComparison objects.
+        
+        Args:
+            local_dir: Local directory path
+            cloud_dir: Cloud directory path
+            last_sync: ISO format string or POSIX timestamp of last sync (optional)
+            
+        Returns:
+            False if compare_directories would skip every file, True otherwise
+        """
+        local_files, cloud_files = self._list_both(local_dir, cloud_dir)
+        if local_files.keys() != cloud_files.keys():
+            return True
+        
+        last_sync_time = self._parse_last_sync(last_sync)
+        for filename, local_stat in local_files.items():
+            mtime = local_stat.st_mtime
+            if mtime != cloud_files[filename].st_mtime:
+                return True
+            # Same file modified on both sides since last sync is a conflict
+            if last_sync_time and mtime > last_sync_time:
+                return True
+        
+        return False
+    
+    def _list_both(self, local_dir: Path, cloud_dir: Path) -> Tuple[Dict[str, os.stat_result], Dict[str, os.stat_result]]:
+        """List local and cloud directories concurrently
+        
+        The two sides usually sit on different devices (local disk, cloud
+        mount), so the cloud listing runs in a worker thread while the local
+        one runs here. The worker is kept for the engine's lifetime so
+        repeated comparisons don't pay for thread startup.
+        
+        Args:
+            local_dir: Local directory path
+            cloud_dir: Cloud directory path
+            
+        Returns:
+            Tuple of (local files, cloud files) as returned by _get_files
+        """
+        if self._scan_executor is None:
+            self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cloud-scan")
+        
+        cloud_future = self._scan_executor.submit(self._get_files, cloud_dir, True)
+        local_files = self._get_files(local_dir)
+        return local_files, cloud_future.result()
+    
+    def _get_files(self, directory: Path, cached_stat: bool = False) -> Dict[str, os.stat_result]:
         """Get all files in directory (non-recursive)
         
         Args:
             directory: Directory to scan
+            cached_stat: Accept cached metadata on network/FUSE mounts (cloud side)
             
         Returns:
-            Set of filenames
+            Dictionary mapping filenames to their stat results
         """
-        if not directory.exists():
-            return set()
-        
-        files = set()
+        files = {}
+        to_stat = []
         try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    files.add(item.name)
-        except PermissionError:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        if cached_stat:
+                            to_stat.append(entry)
+                        else:
+                            files[entry.name] = entry.stat()
+                    except OSError:
+                        # Removed while listing
+                        continue
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             pass
         
+        if to_stat:
+            files.update(self._fast_stat_entries(to_stat))
+        
         return files
     
+    def _fast_stat_entries(self, entries: List[os.DirEntry]) -> Dict[str, os.stat_result]:
+        """Stat directory entries with fast_stat, overlapping calls for large listings
+        
+        Each stat on a network/FUSE mount can wait on a round trip, so big
+        listings keep several requests in flight (the GIL is released
+        during the call). Small listings are stat'ed inline.
+        
+        Args:
+            entries: Directory entries to stat
+            
+        Returns:
+            Dictionary mapping filenames to their stat results
+        """
+        def stat_entry(entry: os.DirEntry) -> Tuple[str, Optional[os.stat_result]]:
+            try:
+                return entry.name, fast_stat(entry.path)
+            except OSError:
+                # Removed while listing
+                return entry.name, None
+        
+        if len(entries) < STAT_BATCH_MIN:
+            results = map(stat_entry, entries)
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAX_STAT_WORKERS) as executor:
+                results = list(executor.map(stat_entry, entries))
+        
+        return {name: st for name, st in results if st is not None}
+    
     def _determine_action(self, comparison: FileComparison, last_sync_time: Optional[float]) -> SyncAction:
         """Determine what action to take for a file
         
@@ -130,8 +371,8 @@ class SyncEngine:
         Returns:
             SyncAction to take
         """
-        local_exists = comparison.local_path and comparison.local_path.exists()
-        cloud_exists = comparison.cloud_path and comparison.cloud_path.exists()
+        local_exists = comparison.local_stat is not None
+        cloud_exists = comparison.cloud_stat is not None
         
         # File only exists locally
         if local_exists and not cloud_exists:
@@ -196,25 +437,23 @@ class SyncEngine:
         """
         try:
             # Ensure destination directory exists
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            if dest.parent not in self._ready_dirs:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Copy file, unless the destination already holds the same data
+            # (e.g. only the timestamp changed): then only metadata is updated
+            source_stat = os.stat(source)
+            if not self._same_contents(source, dest, source_stat):
+                self._copy_contents(source, dest)
             
-            # Copy file
-            shutil.copy2(source, dest) if preserve_timestamp else shutil.copy(source, dest)
+            # Only timestamps come from the source; the mode is set from the directory below
+            if preserve_timestamp:
+                os.utime(dest, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
             
             # Get typical permissions from destination directory
             # This handles cloud storage that may not preserve permissions
             try:
-                # Try to match permissions of other files in the directory
-                if dest.parent.exists():
-                    for sibling in dest.parent.iterdir():
-                        if sibling.is_file() and sibling != dest:
-                            # Copy permissions from existing file
-                            sibling_stat = sibling.stat()
-                            os.chmod(dest, sibling_stat.st_mode)
-                            break
-                    else:
-                        # No other files, use safe default (rw-r--r--)
-                        os.chmod(dest, 0o644)
+                os.chmod(dest, self._get_dir_mode(dest))
             except (OSError, PermissionError):
                 # If we can't set permissions, that's okay
                 # Cloud storage might handle this differently
@@ -226,18 +465,138 @@ class SyncEngine:
             print(f"Error copying {source} to {dest}: {e}")
             return False
     
-    def create_backup(self, file_path: Path, backup_dir: Path, source_label: str = "backup") -> Optional[Path]:
+    @staticmethod
+    def _stat(path: Path) -> Optional[os.stat_result]:
+        """Stat path, returning None if it doesn't exist"""
+        try:
+            return os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+    
+    @staticmethod
+    def _same_contents(source: Path, dest: Path, source_stat: Optional[os.stat_result] = None) -> bool:
+        """Check whether dest already has the same contents as source
+        
+        Args:
+            source: Source file path
+            dest: Destination file path
+            source_stat: Stat result for source, if the caller already has one
+            
+        Returns:
+            True if both files exist, are distinct and have identical bytes
+        """
+        try:
+            if source_stat is None:
+                source_stat = os.stat(source)
+            dest_stat = os.stat(dest)
+        except OSError:
+            return False
+        
+        if source_stat.st_size != dest_stat.st_size or os.path.samestat(source_stat, dest_stat):
+            return False
+        
+        # Read into two reusable buffers instead of allocating per chunk;
+        # full bytearrays compare with memcmp, only the tail is sliced
+        size = min(source_stat.st_size, COMPARE_CHUNK_SIZE)
+        buf_src, buf_dst = bytearray(size), bytearray(size)
+        with open(source, "rb") as fsrc, open(dest, "rb") as fdst:
+            while True:
+                n = fsrc.readinto(buf_src)
+                if fdst.readinto(buf_dst) != n:
+                    return False
+                if not n:
+                    return True
+                if n == size:
+                    if buf_src != buf_dst:
+                        return False
+                elif buf_src[:n] != buf_dst[:n]:
+                    return False
+    
+    @staticmethod
+    def _copy_contents(source: Path, dest: Path):
+        """Copy file data from source to dest
+        
+        Tries os.copy_file_range first, which stays in the kernel and can
+        reflink (Btrfs/XFS) or copy server-side (NFS/SMB). Falls back to
+        shutil.copyfile (sendfile or read/write) where it isn't supported,
+        or where it copies nothing from a non-empty file.
+        
+        Args:
+            source: Source file path
+            dest: Destination file path
+        """
+        if hasattr(os, "copy_file_range"):
+            try:
+                if os.path.samefile(source, dest):
+                    raise shutil.SameFileError(f"{source} and {dest} are the same file")
+            except FileNotFoundError:
+                pass
+            
+            # Only the descriptors are used, so skip the Python-level buffers
+            with open(source, "rb", buffering=0) as fsrc, open(dest, "wb", buffering=0) as fdst:
+                try:
+                    copied = 0
+                    while True:
+                        n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE)
+                        if not n:
+                            break
+                        copied += n
+                    # Some filesystems (procfs-like files, some FUSE mounts)
+                    # report 0 without copying anything: not really EOF
+                    if copied or os.fstat(fsrc.fileno()).st_size == 0:
+                        return
+                except OSError as e:
+                    if e.errno not in COPY_RANGE_FALLBACK_ERRNOS:
+                        raise
+        
+        shutil.copyfile(source, dest)
+    
+    def _get_dir_mode(self, dest: Path) -> int:
+        """Get the permissions of existing files in dest's directory
+        
+        Looked up once per directory and cached until the next sync.
+        
+        Args:
+            dest: Destination file path
+            
+        Returns:
+            Permission bits of the first other file in the directory, or 0o644 if none
+        """
+        mode = self._dir_mode_cache.get(dest.parent)
+        if mode is not None:
+            return mode
+        
+        # No other files, use safe default (rw-r--r--)
+        mode = 0o644
+        with os.scandir(dest.parent) as it:
+            for entry in it:
+                if entry.name != dest.name and entry.is_file():
+                    # Copy permissions from existing file
+                    mode = entry.stat().st_mode & 0o777
+                    break
+        
+        self._dir_mode_cache[dest.parent] = mode
+        return mode
+    
+    def create_backup(self, file_path: Path, backup_dir: Path, source_label: str = "backup",
+                      timestamp: Optional[str] = None) -> Optional[Path]:
         """Create a timestamped backup of a file
         
+        Backups made within the same second get a -1, -2, ... suffix on the
+        timestamp so earlier ones are kept.
+        
         Args:
             file_path: Path to file to backup
             backup_dir: Directory to store backups
             source_label: Label for backup source (e.g., "local", "cloud")
+            timestamp: Timestamp for the backup name (default: now, as YYYYmmdd-HHMMSS)
             
         Returns:
             Path to backup file, or None if failed
         """
-        if not file_path.exists():
+        # One stat both checks existence and supplies the metadata to copy
+        source_stat = self._stat(file_path)
+        if source_stat is None:
             return None
         
         try:
@@ -245,13 +604,23 @@ class SyncEngine:
             backup_dir.mkdir(parents=True, exist_ok=True)
             
             # Create backup filename with timestamp and source
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            if timestamp is None:
+                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
             filename = file_path.name
             backup_name = f"{filename}.{timestamp}.{source_label}.backup"
             backup_path = backup_dir / backup_name
             
-            # Copy file to backup
-            shutil.copy2(file_path, backup_path)
+            # Timestamps have one-second resolution: number repeat backups
+            # within the same second instead of overwriting the earlier one
+            seq = 1
+            while backup_path.exists():
+                backup_path = backup_dir / f"{filename}.{timestamp}-{seq}.{source_label}.backup"
+                seq += 1
+            
+            # Copy file to backup (copy_file_range can reflink it on Btrfs/XFS)
+            self._copy_contents(file_path, backup_path)
+            os.utime(backup_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+            os.chmod(backup_path, source_stat.st_mode & 0o7777)
             
             return backup_path
             
@@ -260,14 +629,14 @@ class SyncEngine:
             return None
     
     def sync_files(self, local_dir: Path, cloud_dir: Path, backup_dir: Path, 
-                   last_sync: Optional[str] = None, dry_run: bool = False) -> Dict[str, Any]:
+                   last_sync: Union[str, float, None] = None, dry_run: bool = False) -> Dict[str, Any]:
         """Synchronize files between local and cloud directories
         
         Args:
             local_dir: Local directory path
             cloud_dir: Cloud directory path
             backup_dir: Backup directory path
-            last_sync: ISO format timestamp of last sync (optional)
+            last_sync: ISO format string or POSIX timestamp of last sync (optional)
             dry_run: If True, only show what would be done (default: False)
             
         Returns:
@@ -284,6 +653,24 @@ class SyncEngine:
         
         # Compare directories
         comparisons = self.compare_directories(local_dir, cloud_dir, last_sync)
+        self._dir_mode_cache.clear()
+        self._ready_dirs.clear()
+        
+        # Check free space once per side before touching anything, rather
+        # than running out halfway through the sync
+        if not dry_run:
+            for dest_dir, needed in self._required_space(comparisons, local_dir, cloud_dir):
+                if needed and not self.verify_disk_space(dest_dir, needed):
+                    results["success"] = False
+                    results["errors"].append(f"Not enough disk space in {dest_dir} ({needed} bytes needed)")
+                    return results
+        
+        # All backups made by this sync share one timestamp
+        backup_timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        
+        # Copies are collected and run together once all backups are made:
+        # (action_result, source, destination, error message)
+        copy_tasks = []
         
         for comp in comparisons:
             action_result = {
@@ -293,9 +680,9 @@ class SyncEngine:
             }
             
             # Add file size information
-            if comp.local_path and comp.local_path.exists():
+            if comp.local_stat is not None:
                 action_result["local_size"] = comp.local_size
-            if comp.cloud_path and comp.cloud_path.exists():
+            if comp.cloud_stat is not None:
                 action_result["cloud_size"] = comp.cloud_size
             
             try:
@@ -308,17 +695,12 @@ class SyncEngine:
                         action_result["dry_run"] = True
                     else:
                         # Backup cloud file if it exists
-                        if comp.cloud_path and comp.cloud_path.exists():
-                            self.create_backup(comp.cloud_path, backup_dir, "cloud")
+                        if comp.cloud_stat is not None:
+                            self.create_backup(comp.cloud_path, backup_dir, "cloud", backup_timestamp)
                         
                         # Copy to cloud
-                        success = self.copy_file(comp.local_path, cloud_dir / comp.filename)
-                        action_result["success"] = success
-                        
-                        if success:
-                            results["files_synced"] += 1
-                        else:
-                            results["errors"].append(f"Failed to copy {comp.filename} to cloud")
+                        copy_tasks.append((action_result, comp.local_path, cloud_dir / comp.filename,
+                                           f"Failed to copy {comp.filename} to cloud"))
                 
                 elif comp.action == SyncAction.COPY_TO_LOCAL:
                     action_result["direction"] = "cloud → local"
@@ -329,17 +711,12 @@ class SyncEngine:
                         action_result["dry_run"] = True
                     else:
                         # Backup local file if it exists
-                        if comp.local_path and comp.local_path.exists():
-                            self.create_backup(comp.local_path, backup_dir, "local")
+                        if comp.local_stat is not None:
+                            self.create_backup(comp.local_path, backup_dir, "local", backup_timestamp)
                         
                         # Copy to local
-                        success = self.copy_file(comp.cloud_path, local_dir / comp.filename)
-                        action_result["success"] = success
-                        
-                        if success:
-                            results["files_synced"] += 1
-                        else:
-                            results["errors"].append(f"Failed to copy {comp.filename} to local")
+                        copy_tasks.append((action_result, comp.cloud_path, local_dir / comp.filename,
+                                           f"Failed to copy {comp.filename} to local"))
                 
                 elif comp.action == SyncAction.CONFLICT:
                     action_result["direction"] = "conflict"
@@ -360,8 +737,72 @@ class SyncEngine:
             
             results["actions"].append(action_result)
         
+        # Create each destination directory once, parents first, instead of once per file
+        for directory in sorted({dest.parent for _, _, dest, _ in copy_tasks}, key=lambda d: len(d.parts)):
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._ready_dirs.add(directory)
+            except OSError:
+                # copy_file retries and reports the error for each file
+                pass
+        
+        # Run the copies, several at a time as each one mostly waits on I/O
+        if len(copy_tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_COPY_WORKERS, len(copy_tasks))) as executor:
+                futures = [executor.submit(self.copy_file, source, dest) for _, source, dest, _ in copy_tasks]
+        else:
+            futures = None
+        
+        for i, (action_result, source, dest, failure) in enumerate(copy_tasks):
+            try:
+                success = futures[i].result() if futures else self.copy_file(source, dest)
+            except Exception as e:
+                action_result["error"] = str(e)
+                results["errors"].append(f"Error processing {action_result['filename']}: {e}")
+                results["success"] = False
+                continue
+            
+            action_result["success"] = success
+            if success:
+                results["files_synced"] += 1
+            else:
+                results["errors"].append(failure)
+        
         return results
     
+    def _required_space(self, comparisons: List[FileComparison], local_dir: Path,
+                        cloud_dir: Path) -> List[Tuple[Path, int]]:
+        """Compute the extra bytes each filesystem needs for the pending copies
+        
+        When both sides live on the same filesystem their needs are summed
+        into one entry, so free space is checked (statvfs) once per device.
+        
+        Args:
+            comparisons: List of FileComparison objects
+            local_dir: Local directory path
+            cloud_dir: Cloud directory path
+            
+        Returns:
+            List of (destination directory, bytes needed) pairs
+        """
+        to_cloud = 0
+        to_local = 0
+        for comp in comparisons:
+            # Overwritten files give back their current size
+            if comp.action == SyncAction.COPY_TO_CLOUD:
+                to_cloud += max(comp.local_size - (comp.cloud_size or 0), 0)
+            elif comp.action == SyncAction.COPY_TO_LOCAL:
+                to_local += max(comp.cloud_size - (comp.local_size or 0), 0)
+        
+        try:
+            same_device = os.stat(local_dir).st_dev == os.stat(cloud_dir).st_dev
+        except OSError:
+            same_device = False
+        
+        if same_device:
+            return [(cloud_dir, to_cloud + to_local)]
+        return [(cloud_dir, to_cloud), (local_dir, to_local)]
+    
     def verify_disk_space(self, dest_dir: Path, required_bytes: int) -> bool:
         """Verify sufficient disk space is available
         
@@ -389,32 +830,20 @@ class SyncEngine:
         Returns:
             Dictionary with counts of each action
         """
-        summary = {
-            "total_files": len(comparisons),
-            "copy_to_cloud": 0,
-            "copy_to_local": 0,
-            "conflicts": 0,
-            "skip": 0,
-            "files": {
-                "copy_to_cloud": [],
-                "copy_to_local": [],
-                "conflicts": [],
-                "skip": []
-            }
+        files = {
+            "copy_to_cloud": [],
+            "copy_to_local": [],
+            "conflicts": [],
+            "skip": []
         }
         
+        # Group filenames by action; counts are the group sizes
+        summary_keys = self.SUMMARY_KEYS
         for comp in comparisons:
-            if comp.action == SyncAction.COPY_TO_CLOUD:
-                summary["copy_to_cloud"] += 1
-                summary["files"]["copy_to_cloud"].append(comp.filename)
-            elif comp.action == SyncAction.COPY_TO_LOCAL:
-                summary["copy_to_local"] += 1
-                summary["files"]["copy_to_local"].append(comp.filename)
-            elif comp.action == SyncAction.CONFLICT:
-                summary["conflicts"] += 1
-                summary["files"]["conflicts"].append(comp.filename)
-            else:
-                summary["skip"] += 1
-                summary["files"]["skip"].append(comp.filename)
+            files[summary_keys[comp.action]].append(comp.filename)
+        
+        summary = {"total_files": len(comparisons)}
+        summary.update((key, len(names)) for key, names in files.items())
+        summary["files"] = files
         
         return summary
@@ -5,7 +5,11 @@ Handles parsing of binary VDF files (shortcuts.vdf)
 
 import struct
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+
+# Little-endian uint32 as stored in binary VDF
+INT32 = struct.Struct('<I')
 
 
 class VDFParser:
@@ -24,8 +28,15 @@ class VDFParser:
             file_path: Path to VDF file
         """
         self.file_path = file_path
-        self.data = None
-        self.position = 0
+        self.data: bytes = b''
+        self.position: int = 0
+        
+        # Entry type -> reader for the value following the entry's key
+        self._value_readers = {
+            self.TYPE_SECTION: self._read_section,
+            self.TYPE_STRING: self._read_cstring,
+            self.TYPE_INT32: self._read_int32
+        }
     
     def parse(self) -> Dict[str, Any]:
         """Parse VDF file
@@ -39,60 +50,78 @@ class VDFParser:
         self.position = 0
         return self._parse_section()
     
-    def _read_cstring(self) -> str:
+    @staticmethod
+    def _read_cstring(data: bytes, pos: int) -> Tuple[str, int]:
         """Read null-terminated string
         
+        Args:
+            data: VDF file contents
+            pos: Offset of the string
+            
         Returns:
-            String value
+            Tuple of (string value, offset after the null terminator)
         """
-        start = self.position
-        while self.position < len(self.data) and self.data[self.position] != 0:
-            self.position += 1
+        end = data.find(0, pos)
+        if end < 0:
+            # Missing terminator: string runs to end of data
+            end = max(pos, len(data))
         
-        result = self.data[start:self.position].decode('utf-8', errors='ignore')
-        self.position += 1  # Skip null terminator
-        return result
+        return data[pos:end].decode('utf-8', errors='ignore'), end + 1
     
-    def _read_int32(self) -> int:
+    @staticmethod
+    def _read_int32(data: bytes, pos: int) -> Tuple[int, int]:
         """Read 32-bit integer
         
+        Args:
+            data: VDF file contents
+            pos: Offset of the integer
+            
         Returns:
-            Integer value
+            Tuple of (integer value, offset after the integer)
         """
-        value = struct.unpack('<I', self.data[self.position:self.position + 4])[0]
-        self.position += 4
-        return value
+        return INT32.unpack_from(data, pos)[0], pos + 4
+    
+    def _read_section(self, data: bytes, pos: int) -> Tuple[Dict[str, Any], int]:
+        """Read nested section
+        
+        Args:
+            data: VDF file contents
+            pos: Offset of the section's first entry
+            
+        Returns:
+            Tuple of (section dictionary, offset after the section end marker)
+        """
+        self.position = pos
+        value = self._parse_section()
+        return value, self.position
     
     def _parse_section(self) -> Dict[str, Any]:
-        """Parse a section (dictionary)
+        """Parse a section (dictionary) starting at self.position
         
         Returns:
             Dictionary of parsed data
         """
+        # Parse state is kept in locals and written back to self.position
+        # only around nested sections
+        data = self.data
+        size = len(data)
+        pos = self.position
+        read_cstring = self._read_cstring
+        value_readers = self._value_readers
         result = {}
         
-        while self.position < len(self.data):
-            type_byte = self.data[self.position]
-            self.position += 1
+        while pos < size:
+            reader = value_readers.get(data[pos])
+            pos += 1
             
-            if type_byte == self.TYPE_END:
-                break
-            elif type_byte == self.TYPE_SECTION:
-                key = self._read_cstring()
-                value = self._parse_section()
-                result[key] = value
-            elif type_byte == self.TYPE_STRING:
-                key = self._read_cstring()
-                value = self._read_cstring()
-                result[key] = value
-            elif type_byte == self.TYPE_INT32:
-                key = self._read_cstring()
-                value = self._read_int32()
-                result[key] = value
-            else:
-                # Unknown type, try to skip
+            if reader is None:
+                # End of section, or unknown type we can't skip
                 break
+            
+            key, pos = read_cstring(data, pos)
+            result[key], pos = reader(data, pos)
         
+        self.position = pos
         return result
 
 
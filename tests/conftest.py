@@ -0,0 +1,30 @@
+"""pytest configuration shared by all test files"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.run_tests import ram_temp_root
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ram_tempdir():
+    """Point tempfile at a RAM-backed directory for the whole session"""
+    root = ram_temp_root()
+    if root is None:
+        yield None
+        return
+    
+    old_tempdir = tempfile.tempdir
+    tempfile.tempdir = root
+    try:
+        yield Path(root)
+    finally:
+        tempfile.tempdir = old_tempdir
+        shutil.rmtree(root, ignore_errors=True)
@@ -1,25 +1,57 @@
 #!/usr/bin/env python3
 """Run all tests for the game sync tool"""
 
+import os
 import sys
+import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def run_test_file(test_file):
-    """Run a single test file and return results"""
-    print(f"\n{'='*60}")
-    print(f"Running {test_file}")
-    print(f"{'='*60}")
+def ram_temp_root():
+    """Create a RAM-backed directory for temporary files, if available
     
-    result = subprocess.run(
+    Tests create many small files; on tmpfs those writes never hit the disk.
+    
+    Returns:
+        New directory under /dev/shm on Linux, or None to use the system default
+    """
+    shm = Path("/dev/shm")
+    if sys.platform.startswith("linux") and shm.is_dir():
+        try:
+            return tempfile.mkdtemp(prefix="gamesync-tests-", dir=shm)
+        except OSError:
+            pass
+    return None
+
+def run_test_file(test_file, env=None):
+    """Run a single test file and return the completed process"""
+    return subprocess.run(
         [sys.executable, test_file],
         capture_output=True,
         text=True,
-        cwd=Path(__file__).parent.parent  # Run from project root
+        cwd=Path(__file__).parent.parent,  # Run from project root
+        env=env
     )
+
+def report_test_file(test_file, result, quiet=False):
+    """Print a test file's output and return whether it passed
+    
+    With quiet set, passing suites get a one-line summary and only failing
+    suites print their full output.
+    """
+    if quiet and result.returncode == 0:
+        print(f"✓ {test_file}")
+        return True
+    
+    print(f"\n{'='*60}")
+    print(f"Running {test_file}")
+    print(f"{'='*60}")
     
     print(result.stdout)
     if result.stderr:
@@ -28,12 +60,17 @@ def run_test_file(test_file):
     return result.returncode == 0
 
 def main():
-    """Run all test files"""
+    """Run all test files
+    
+    Pass -q/--quiet to show full output only for failing suites.
+    """
+    quiet = "-q" in sys.argv[1:] or "--quiet" in sys.argv[1:]
     tests_dir = Path(__file__).parent
     test_files = [
         'tests/test_config.py',
         'tests/test_logger.py',
         'tests/test_detector.py',
+        'tests/test_save_detector.py',
         'tests/test_sync.py',
         'tests/test_conflict.py',
         'tests/test_integration.py',
@@ -43,14 +80,30 @@ def main():
     print("Running All Tests")
     print("="*60)
     
+    # Keep the tests' temporary files in RAM when possible
+    temp_root = ram_temp_root()
+    env = dict(os.environ, TMPDIR=temp_root) if temp_root else None
+    
+    # Suites are independent processes: run them all at once and report
+    # each one's output in order as it finishes
     results = {}
-    for test_file in test_files:
-        test_path = Path(__file__).parent.parent / test_file
-        if test_path.exists():
-            results[test_file] = run_test_file(test_path)
-        else:
-            print(f"⚠ Warning: {test_file} not found")
-            results[test_file] = False
+    try:
+        with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+            runs = {}
+            for test_file in test_files:
+                test_path = Path(__file__).parent.parent / test_file
+                if test_path.exists():
+                    runs[test_file] = executor.submit(run_test_file, test_path, env)
+            
+            for test_file in test_files:
+                if test_file in runs:
+                    results[test_file] = report_test_file(test_file, runs[test_file].result(), quiet)
+                else:
+                    print(f"⚠ Warning: {test_file} not found")
+                    results[test_file] = False
+    finally:
+        if temp_root:
+            shutil.rmtree(temp_root, ignore_errors=True)
     
     # Summary
     print("\n" + "="*60)
@@ -3,11 +3,14 @@
 Test script for configuration validation
 """
 
+import os
 import sys
+import tempfile
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_manager import ConfigManager, ConfigError
 
@@ -31,15 +34,13 @@ def test_load_valid_config():
 def test_invalid_toml():
     """Test handling of invalid TOML syntax"""
     print("\nTest 2: Testing invalid TOML handling...")
-    config_mgr = ConfigManager()
     
-    # Create a temporary invalid config
-    backup_file = config_mgr.config_file.with_suffix('.toml.backup')
-    config_mgr.config_file.rename(backup_file)
-    
-    try:
-        with open(config_mgr.config_file, 'w') as f:
-            f.write("[invalid\nthis is not valid toml")
+    # Private config dir: the real config is never touched, even by suites
+    # running at the same time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_mgr = ConfigManager(Path(tmpdir))
+        config_mgr.config_file.parent.mkdir(parents=True, exist_ok=True)
+        config_mgr.config_file.write_text("[invalid\nthis is not valid toml")
         
         try:
             config_mgr.load_config()
@@ -48,10 +49,6 @@ def test_invalid_toml():
         except ConfigError as e:
             print(f"✓ Correctly caught invalid TOML: {str(e)[:50]}...")
             return True
-    finally:
-        # Restore original config
-        config_mgr.config_file.unlink(missing_ok=True)
-        backup_file.rename(config_mgr.config_file)
 
 
 def test_missing_section():
@@ -169,6 +166,33 @@ def test_list_games():
     return True
 
 
+def test_config_cache():
+    """Test parsed config is reused until the file changes"""
+    print("\nTest 8: Testing config load caching...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_mgr = ConfigManager(Path(tmpdir))
+        config_mgr.initialize()
+        
+        # Callers get independent copies
+        config = config_mgr.load_config()
+        config["general"]["cloud_directory"] = "/modified"
+        assert config_mgr.load_config()["general"]["cloud_directory"] == ""
+        
+        # Saving invalidates the cache
+        config_mgr.save_config(config)
+        assert config_mgr.load_config()["general"]["cloud_directory"] == "/modified"
+        
+        # External edits are picked up through the file's mtime and size
+        text = config_mgr.config_file.read_text().replace("/modified", "/edited")
+        config_mgr.config_file.write_text(text)
+        os.utime(config_mgr.config_file, ns=(0, 0))
+        assert config_mgr.load_config()["general"]["cloud_directory"] == "/edited"
+    
+    print("✓ Config cache reused and invalidated")
+    return True
+
+
 def main():
     print("=== Configuration Parser Tests ===\n")
     
@@ -179,7 +203,8 @@ def main():
         test_invalid_os,
         test_game_config,
         test_invalid_game_config,
-        test_list_games
+        test_list_games,
+        test_config_cache
     ]
     
     results = []
@@ -1,32 +1,62 @@
 #!/usr/bin/env python3
 """Tests for conflict resolution"""
 
+import os
 import sys
 import tempfile
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.conflict_resolver import ConflictResolver, ResolutionStrategy
 
 
+def make_file_pair(tmpdir, local_data, cloud_data, local_mtime=None, cloud_mtime=None,
+                   name="save.dat"):
+    """Create a local/cloud pair of the same save file
+    
+    Args:
+        tmpdir: Test directory (gets local/ and cloud/ subdirectories)
+        local_data: Bytes for the local file
+        cloud_data: Bytes for the cloud file
+        local_mtime: Modification time for the local file (default: now)
+        cloud_mtime: Modification time for the cloud file (default: now)
+        name: File name
+    
+    Returns:
+        Tuple of (local_path, cloud_path)
+    """
+    local_path = Path(tmpdir) / "local" / name
+    cloud_path = Path(tmpdir) / "cloud" / name
+    
+    for path, data, mtime in ((local_path, local_data, local_mtime), (cloud_path, cloud_data, cloud_mtime)):
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+    
+    return local_path, cloud_path
+
+
+def list_saves(directory):
+    """List save*.dat file names in a directory"""
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries if e.name.startswith("save") and e.name.endswith(".dat")]
+
+
 def test_conflict_detection():
     """Test conflict detection"""
     print("\nTest 1: Conflict detection...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
         # Create files with different timestamps (ensure > 2 second difference)
-        local_path.write_text("local version")
-        time.sleep(2.5)
-        cloud_path.write_text("cloud version")
+        now = time.time()
+        local_path, cloud_path = make_file_pair(tmpdir, b"local version", b"cloud version",
+                                                local_mtime=now - 10, cloud_mtime=now)
         
         resolver = ConflictResolver()
         
@@ -42,14 +72,8 @@ def test_no_conflict_same_time():
     print("\nTest 2: No conflict with same timestamp...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
         # Create identical files
-        local_path.write_text("same content")
-        cloud_path.write_text("same content")
+        local_path, cloud_path = make_file_pair(tmpdir, b"same content", b"same content")
         
         resolver = ConflictResolver()
         
@@ -65,17 +89,11 @@ def test_conflict_with_last_sync():
     print("\nTest 3: Conflict detection with last_sync...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
         # Set last sync to 1 hour ago
-        last_sync = (datetime.now() - timedelta(hours=1)).isoformat()
+        last_sync = time.time() - 3600
         
         # Create files (both newer than last_sync)
-        local_path.write_text("local version")
-        cloud_path.write_text("cloud version")
+        local_path, cloud_path = make_file_pair(tmpdir, b"local version", b"cloud version")
         
         resolver = ConflictResolver()
         
@@ -91,14 +109,8 @@ def test_conflict_backup():
     print("\nTest 4: Conflict backup creation...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
+        local_path, cloud_path = make_file_pair(tmpdir, b"local content", b"cloud content")
         backup_dir = Path(tmpdir) / "backups"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("local content")
-        cloud_path.write_text("cloud content")
         
         resolver = ConflictResolver()
         backups = resolver.create_conflict_backup(local_path, cloud_path, backup_dir)
@@ -119,13 +131,7 @@ def test_conflict_info():
     print("\nTest 5: Get conflict information...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("local")
-        cloud_path.write_text("cloud data")
+        local_path, cloud_path = make_file_pair(tmpdir, b"local", b"cloud data")
         
         resolver = ConflictResolver()
         info = resolver.get_conflict_info(local_path, cloud_path)
@@ -145,14 +151,8 @@ def test_resolve_keep_local():
     print("\nTest 6: Resolve conflict - keep local...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
+        local_path, cloud_path = make_file_pair(tmpdir, b"local version", b"cloud version")
         backup_dir = Path(tmpdir) / "backups"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("local version")
-        cloud_path.write_text("cloud version")
         
         resolver = ConflictResolver()
         success = resolver.resolve_conflict(
@@ -162,7 +162,8 @@ def test_resolve_keep_local():
         )
         
         assert success
-        assert cloud_path.read_text() == "local version"
+        assert cloud_path.read_bytes() == b"local version"
+        assert len(list(backup_dir.iterdir())) == 2
         
         print("  ✓ Kept local version, copied to cloud")
         return True
@@ -173,14 +174,8 @@ def test_resolve_keep_cloud():
     print("\nTest 7: Resolve conflict - keep cloud...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
+        local_path, cloud_path = make_file_pair(tmpdir, b"local version", b"cloud version")
         backup_dir = Path(tmpdir) / "backups"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("local version")
-        cloud_path.write_text("cloud version")
         
         resolver = ConflictResolver()
         success = resolver.resolve_conflict(
@@ -190,7 +185,7 @@ def test_resolve_keep_cloud():
         )
         
         assert success
-        assert local_path.read_text() == "cloud version"
+        assert local_path.read_bytes() == b"cloud version"
         
         print("  ✓ Kept cloud version, copied to local")
         return True
@@ -201,14 +196,8 @@ def test_resolve_keep_both():
     print("\nTest 8: Resolve conflict - keep both...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
+        local_path, cloud_path = make_file_pair(tmpdir, b"local version", b"cloud version")
         backup_dir = Path(tmpdir) / "backups"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("local version")
-        cloud_path.write_text("cloud version")
         
         resolver = ConflictResolver()
         success = resolver.resolve_conflict(
@@ -220,15 +209,18 @@ def test_resolve_keep_both():
         assert success
         
         # Original files should be renamed
-        local_files = list(local_path.parent.glob("save*.dat"))
-        cloud_files = list(cloud_path.parent.glob("save*.dat"))
+        local_files = list_saves(local_path.parent)
+        cloud_files = list_saves(cloud_path.parent)
         
         assert len(local_files) == 1
         assert len(cloud_files) == 1
-        assert "local" in local_files[0].name
-        assert "cloud" in cloud_files[0].name
+        assert "local" in local_files[0]
+        assert "cloud" in cloud_files[0]
+        
+        # Nothing was overwritten, so no backups are made
+        assert not backup_dir.exists()
         
-        print(f"  ✓ Kept both versions: {local_files[0].name}, {cloud_files[0].name}")
+        print(f"  ✓ Kept both versions: {local_files[0]}, {cloud_files[0]}")
         return True
 
 
@@ -237,13 +229,7 @@ def test_conflict_tracking():
     print("\nTest 9: Conflict tracking...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
-        local_path = Path(tmpdir) / "local" / "save1.dat"
-        cloud_path = Path(tmpdir) / "cloud" / "save1.dat"
-        local_path.parent.mkdir()
-        cloud_path.parent.mkdir()
-        
-        local_path.write_text("data")
-        cloud_path.write_text("data")
+        local_path, cloud_path = make_file_pair(tmpdir, b"data", b"data", name="save1.dat")
         
         resolver = ConflictResolver()
         
@@ -262,6 +248,64 @@ def test_conflict_tracking():
         return True
 
 
+def test_conflict_missing_file():
+    """Test conflict checks when one side is missing"""
+    print("\nTest 10: Conflict with missing file...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_path = Path(tmpdir) / "local" / "save.dat"
+        cloud_path = Path(tmpdir) / "cloud" / "save.dat"
+        local_path.parent.mkdir()
+        local_path.write_bytes(b"only local")
+        
+        resolver = ConflictResolver()
+        
+        # Missing cloud file (and directory) is never a conflict
+        assert not resolver.detect_conflict(local_path, cloud_path)
+        
+        info = resolver.get_conflict_info(local_path, cloud_path)
+        assert info["local"]["size"] == len("only local")
+        assert info["cloud"] == {}
+        
+        print("  ✓ Missing file handled")
+        return True
+
+
+def test_no_conflict_same_contents():
+    """Test identical contents are not a conflict despite timestamps"""
+    print("\nTest 11: No conflict with identical contents...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        payload = os.urandom(1 << 20)
+        now = time.time()
+        local_path, cloud_path = make_file_pair(tmpdir, payload, payload,
+                                                local_mtime=now - 10, cloud_mtime=now)
+        
+        resolver = ConflictResolver()
+        
+        # Same bytes: hashes match, no conflict with or without last_sync
+        last_sync = (datetime.now() - timedelta(hours=1)).isoformat()
+        assert not resolver.detect_conflict(local_path, cloud_path)
+        assert not resolver.detect_conflict(local_path, cloud_path, last_sync)
+        
+        # Unchanged files are hashed once
+        assert len(resolver._digest_cache) == 2
+        
+        # Same size, one byte different, mtime restored: still rehashed.
+        # The cache is bounded, so the stale cloud digest is evicted.
+        resolver.DIGEST_CACHE_MAX_ENTRIES = 2
+        cloud_path.write_bytes(payload[:-1] + bytes([payload[-1] ^ 1]))
+        os.utime(cloud_path, (now, now))
+        assert resolver.detect_conflict(local_path, cloud_path)
+        
+        keys = {(st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+                for st in (local_path.stat(), cloud_path.stat())}
+        assert set(resolver._digest_cache) == keys
+        
+        print("  ✓ Identical 1 MB files not in conflict")
+        return True
+
+
 def run_all_tests():
     """Run all conflict resolver tests"""
     print("=" * 50)
@@ -278,6 +322,8 @@ def run_all_tests():
         test_resolve_keep_cloud,
         test_resolve_keep_both,
         test_conflict_tracking,
+        test_conflict_missing_file,
+        test_no_conflict_same_contents,
     ]
     
     passed = 0
@@ -3,19 +3,33 @@
 Test script for game detection
 """
 
+import contextlib
+import io
 import sys
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.game_detector import GameDetector
+from src.vdf_parser import ShortcutsParser
+
+
+@lru_cache(maxsize=None)
+def shared_detector():
+    """GameDetector reused by the tests that probe the real Steam installation"""
+    return GameDetector()
 
 
 def test_steam_detection():
     """Test Steam installation detection"""
     print("Test 1: Detecting Steam installation...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     steam_path = detector.detect_steam_path()
     
     if steam_path:
@@ -30,7 +44,7 @@ def test_userdata_detection():
     """Test userdata directory detection"""
     print("\nTest 2: Detecting userdata directory...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     userdata_path = detector.detect_userdata_path()
     
     if userdata_path:
@@ -45,7 +59,7 @@ def test_user_ids():
     """Test Steam user ID detection"""
     print("\nTest 3: Detecting Steam user IDs...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     user_ids = detector.detect_user_ids()
     
     if user_ids:
@@ -60,7 +74,7 @@ def test_shortcuts_path():
     """Test shortcuts.vdf path detection"""
     print("\nTest 4: Detecting shortcuts.vdf files...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     detector.detect_user_ids()
     
     found_any = False
@@ -84,7 +98,7 @@ def test_non_steam_games():
     """Test non-Steam game detection"""
     print("\nTest 5: Detecting non-Steam games...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     games = detector.detect_non_steam_games()
     
     if games:
@@ -105,7 +119,7 @@ def test_save_locations():
     """Test save location detection"""
     print("\nTest 6: Detecting save locations...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     games = detector.detect_non_steam_games()
     
     if not games:
@@ -133,7 +147,7 @@ def test_detect_all():
     """Test complete detection"""
     print("\nTest 7: Running complete detection...")
     
-    detector = GameDetector()
+    detector = shared_detector()
     results = detector.detect_all()
     
     print(f"  OS Type: {detector.os_type}")
@@ -167,6 +181,7 @@ def test_custom_directories():
     
     # Test with a non-existent path (should handle gracefully)
     detector = GameDetector(custom_paths=["/nonexistent/path"])
+    assert detector.custom_paths == []
     custom_games = detector.scan_custom_directories()
     
     print(f"  Found {len(custom_games)} games in custom directories")
@@ -178,6 +193,52 @@ def test_custom_directories():
     return True
 
 
+def test_custom_directories_scan():
+    """Test custom directory scanning finds game executables"""
+    print("\nTest 11: Testing custom directory game discovery...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        games_dir = Path(tmpdir) / "Games"
+        (games_dir / "My Game").mkdir(parents=True)
+        (games_dir / "My Game" / "game.exe").write_text("")
+        (games_dir / "No Exe").mkdir()
+        (games_dir / "Locked").mkdir()
+        (games_dir / "readme.txt").write_text("")
+        
+        # An unreadable game folder only skips that folder. Permissions are
+        # faked so this also fails for root.
+        locked = str(games_dir / "Locked")
+        real_scandir = os.scandir
+        
+        def scandir(path="."):
+            if os.fspath(path) == locked:
+                raise PermissionError(13, "Permission denied", locked)
+            return real_scandir(path)
+        
+        detector = GameDetector(custom_paths=[str(games_dir)])
+        output = io.StringIO()
+        os.scandir = scandir
+        try:
+            with contextlib.redirect_stdout(output):
+                custom_games = detector.scan_custom_directories()
+        finally:
+            os.scandir = real_scandir
+        assert "Warning" not in output.getvalue()
+        
+        assert len(custom_games) == 1
+        game = custom_games[0]
+        assert game['name'] == "My Game"
+        assert game['exe'] == str(games_dir / "My Game" / "game.exe")
+        assert game['start_dir'] == str(games_dir / "My Game")
+        assert game['custom_path'] == str(games_dir)
+        
+        # Folder removed between listing and scanning it
+        assert detector._find_exe(str(games_dir / "Removed")) is None
+    
+    print("✓ Custom directory game discovered")
+    return True
+
+
 def test_game_config_creation():
     """Test game configuration creation and saving"""
     print("\nTest 9: Testing game configuration creation...")
@@ -227,6 +288,118 @@ def test_game_config_creation():
     print("  ✗ Failed to save/verify config")
     return False
 
+def test_detect_all_cache():
+    """Test detect_all reuses results while tracked paths are unchanged"""
+    print("\nTest 10: Testing detect_all result caching...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old_home = os.environ.get("HOME")
+        os.environ["HOME"] = tmpdir
+        try:
+            # Create mock Steam structure with one user
+            userdata = Path(tmpdir) / ".local" / "share" / "Steam" / "userdata"
+            (userdata / "12345" / "config").mkdir(parents=True)
+            
+            detector = GameDetector(os_type="linux")
+            first = detector.detect_all()
+            assert first["user_ids"] == ["12345"]
+            assert first["shortcuts_files"] == []
+            
+            # Nothing changed: cached copy is returned
+            detector.scan_custom_directories = lambda: [{'name': 'unexpected'}]
+            second = detector.detect_all()
+            assert second == first
+            assert second is not first
+            del detector.scan_custom_directories
+            
+            # New user appears: userdata mtime changes and triggers a rescan
+            (userdata / "67890").mkdir()
+            os.utime(userdata, ns=(0, 0))
+            third = detector.detect_all()
+            assert third["user_ids"] == ["12345", "67890"]
+        finally:
+            if old_home is None:
+                del os.environ["HOME"]
+            else:
+                os.environ["HOME"] = old_home
+    
+    print("✓ detect_all cache invalidates on change")
+    return True
+
+
+def test_parse_shortcuts_vdf():
+    """Test parsing a binary shortcuts.vdf file"""
+    print("\nTest 12: Parsing shortcuts.vdf...")
+    
+    data = (
+        b"\x00shortcuts\x00"
+        b"\x000\x00"
+        b"\x02appid\x00" + (3000000000).to_bytes(4, "little") +
+        b"\x01AppName\x00Hollow Knight\x00"
+        b"\x01Exe\x00\"/games/hk/hk.exe\"\x00"
+        b"\x01StartDir\x00\"/games/hk/\"\x00"
+        b"\x08"
+        b"\x001\x00"
+        b"\x01AppName\x00Celeste\x00"
+        b"\x08\x08\x08"
+    )
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vdf_path = Path(tmpdir) / "shortcuts.vdf"
+        vdf_path.write_bytes(data)
+        games = ShortcutsParser(vdf_path).parse()
+        
+        assert [g['name'] for g in games] == ["Hollow Knight", "Celeste"]
+        assert games[0]['app_id'] == 3000000000
+        assert games[0]['start_dir'] == '"/games/hk/"'
+        
+        # Truncated file: last string runs to end of data
+        vdf_path.write_bytes(b"\x00shortcuts\x00\x000\x00\x01AppName\x00Trunc")
+        games = ShortcutsParser(vdf_path).parse()
+        assert [g['name'] for g in games] == ["Trunc"]
+    
+    print("✓ shortcuts.vdf parsed")
+    return True
+
+
+def test_detection_memoized():
+    """Test Steam detection runs once per detector"""
+    print("\nTest 13: Memoizing Steam detection...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        old_home = os.environ.get("HOME")
+        os.environ["HOME"] = tmpdir
+        try:
+            userdata = Path(tmpdir) / ".local" / "share" / "Steam" / "userdata"
+            (userdata / "12345").mkdir(parents=True)
+            
+            detector = GameDetector(os_type="linux")
+            assert detector.detect_user_ids() == ["12345"]
+            
+            # Later calls reuse the probed paths
+            detector._detect_steam_linux = lambda: None
+            assert detector.detect_steam_path() == userdata.parent
+            assert detector.detect_userdata_path() == userdata
+            del detector._detect_steam_linux
+            
+            # User list follows the userdata directory
+            (userdata / "67890").mkdir()
+            os.utime(userdata, ns=(0, 0))
+            assert detector.detect_user_ids() == ["12345", "67890"]
+            
+            detector.reset_detection()
+            assert detector.user_ids == []
+            assert detector.detect_steam_path() == userdata.parent
+        finally:
+            if old_home is None:
+                del os.environ["HOME"]
+            else:
+                os.environ["HOME"] = old_home
+    
+    print("✓ Detection cached until reset")
+    return True
+
+
 def main():
     print("=== Game Detection Tests ===\n")
     
@@ -239,7 +412,11 @@ def main():
         test_save_locations,
         test_detect_all,
         test_custom_directories,
-        test_game_config_creation
+        test_game_config_creation,
+        test_detect_all_cache,
+        test_custom_directories_scan,
+        test_parse_shortcuts_vdf,
+        test_detection_memoized
     ]
     
     results = []
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Integration tests for end-to-end workflows"""
 
+import os
 import sys
 import tempfile
 import time
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config_manager import ConfigManager
 from src.game_detector import GameDetector
@@ -34,6 +36,9 @@ def test_end_to_end_sync_workflow():
         # Create test save files
         (local_dir / "save1.dat").write_text("save data 1")
         (local_dir / "save2.dat").write_text("save data 2")
+        now = time.time()
+        os.utime(local_dir / "save1.dat", (now - 10, now - 10))
+        os.utime(local_dir / "save2.dat", (now - 10, now - 10))
         
         # Perform sync
         sync_engine = SyncEngine()
@@ -47,7 +52,6 @@ def test_end_to_end_sync_workflow():
         assert (cloud_dir / "save1.dat").read_text() == "save data 1"
         
         # Modify cloud file
-        time.sleep(0.1)
         (cloud_dir / "save1.dat").write_text("modified in cloud")
         
         # Sync back
@@ -80,8 +84,7 @@ def test_conflict_resolution_workflow():
         (cloud_dir / "save.dat").write_text("initial")
         
         # Record sync time
-        last_sync = datetime.now().isoformat()
-        time.sleep(0.1)
+        last_sync = datetime.fromtimestamp(time.time() - 10).isoformat()
         
         # Modify both (create conflict)
         (local_dir / "save.dat").write_text("local change")
@@ -108,8 +111,8 @@ def test_conflict_resolution_workflow():
         assert (cloud_dir / "save.dat").read_text() == "local change"
         
         # Verify backup was created
-        backups = list(backup_dir.glob("*.conflict"))
-        assert len(backups) == 2  # local and cloud backups
+        with os.scandir(backup_dir) as entries:
+            assert sum(1 for e in entries if e.name.endswith(".conflict")) == 2  # local and cloud backups
         
         print("  ✓ Conflict resolution workflow works")
         return True
@@ -159,10 +162,12 @@ def test_backup_workflow():
         # Create initial files
         (local_dir / "save.dat").write_text("version 1")
         (cloud_dir / "save.dat").write_text("version 1")
+        now = time.time()
+        os.utime(local_dir / "save.dat", (now - 20, now - 20))
+        os.utime(cloud_dir / "save.dat", (now - 20, now - 20))
         
         # Sync with last_sync set
-        last_sync = datetime.now().isoformat()
-        time.sleep(0.1)
+        last_sync = datetime.fromtimestamp(now - 10).isoformat()
         
         # Modify local (newer)
         (local_dir / "save.dat").write_text("version 2")
@@ -172,10 +177,11 @@ def test_backup_workflow():
         results = sync_engine.sync_files(local_dir, cloud_dir, backup_dir, last_sync)
         
         # Verify backup was created
-        backups = list(backup_dir.glob("*.backup"))
+        with os.scandir(backup_dir) as entries:
+            backups = [e for e in entries if e.name.endswith(".backup")]
         assert len(backups) == 1
         assert "cloud" in backups[0].name
-        assert backups[0].read_text() == "version 1"
+        assert Path(backups[0].path).read_text() == "version 1"
         
         # Verify cloud was updated
         assert (cloud_dir / "save.dat").read_text() == "version 2"
@@ -4,12 +4,16 @@ Test script for logging system
 """
 
 import sys
+import logging
+import tempfile
 from pathlib import Path
 import time
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.logger import init_logger, get_logger
+from src.logger import init_logger, get_logger, FastRotatingFileHandler
 
 
 def test_basic_logging():
@@ -53,6 +57,9 @@ def test_log_levels():
     logger.info("Info at warning level (should not appear in console)")
     logger.warning("Warning at warning level (should appear)")
     
+    # Re-initializing replaces the handlers instead of stacking them
+    assert len(logger.logger.handlers) == 2
+    
     print("✓ Log levels work correctly")
     return True
 
@@ -95,6 +102,120 @@ def test_global_logger():
         return False
 
 
+def test_close_flushes_file():
+    """Test queued file writes are flushed on close"""
+    print("\nTest 6: Testing log flush on close...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = init_logger(Path(tmpdir), "info", verbose=False)
+        for i in range(100):
+            logger.debug(f"queued message {i}")
+        logger.close()
+        logger.close()  # Safe to call twice
+        
+        lines = (Path(tmpdir) / "gamesync.log").read_text().splitlines()
+        assert len(lines) == 100
+        assert lines[-1].endswith("DEBUG - queued message 99")
+    
+    print("✓ Pending messages written on close")
+    return True
+
+
+def test_rotation():
+    """Test log rotation with the size-tracking file handler"""
+    print("\nTest 7: Testing log rotation...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_file = Path(tmpdir) / "rotate.log"
+        handler = FastRotatingFileHandler(log_file, maxBytes=200, backupCount=2, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        for i in range(50):
+            record = logging.LogRecord("test", logging.INFO, __file__, 0, f"message {i:02d}", None, None)
+            handler.handle(record)
+        handler.close()
+        
+        assert (Path(tmpdir) / "rotate.log.1").exists()
+        assert (Path(tmpdir) / "rotate.log.2").exists()
+        assert not (Path(tmpdir) / "rotate.log.3").exists()
+        assert log_file.stat().st_size < 200
+        assert log_file.read_text().splitlines()[-1] == "message 49"
+    
+    print("✓ Log files rotated at size limit")
+    return True
+
+
+def test_no_console_handler():
+    """Test console output can be disabled"""
+    print("\nTest 8: Testing logger without console handler...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = init_logger(Path(tmpdir), "info", console=False)
+        handlers = logger.logger.handlers
+        assert not any(type(h) is logging.StreamHandler for h in handlers)
+        assert not logger.logger.propagate
+        
+        logger.info("file only")
+        logger.close()
+        assert "file only" in (Path(tmpdir) / "gamesync.log").read_text()
+    
+    print("✓ Logging to file only")
+    return True
+
+
+def test_flush_when_idle():
+    """Test buffered file writes reach disk once the queue drains"""
+    print("\nTest 9: Testing buffered writes flush when idle...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = init_logger(Path(tmpdir), "info", console=False)
+        log_file = Path(tmpdir) / "gamesync.log"
+        for i in range(200):
+            logger.info(f"burst message {i}")
+        
+        # No close(): the listener flushes on its own after the burst
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if log_file.read_text().endswith("burst message 199\n"):
+                break
+            time.sleep(0.01)
+        assert len(log_file.read_text().splitlines()) == 200
+        logger.close()
+    
+    print("✓ Buffered messages flushed when idle")
+    return True
+
+
+def test_flush_level():
+    """Test records below flush_level stay buffered until a flush"""
+    print("\nTest 10: Testing deferred flushing...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_file = Path(tmpdir) / "buffered.log"
+        handler = FastRotatingFileHandler(log_file, mode='w', maxBytes=1 << 20, encoding='utf-8',
+                                          flush_level=logging.ERROR)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        
+        def log(level, msg):
+            handler.handle(logging.LogRecord("test", level, __file__, 0, msg, None, None))
+        
+        log(logging.INFO, "buffered")
+        assert log_file.read_text() == ""
+        
+        # Errors flush everything written so far
+        log(logging.ERROR, "flushed")
+        assert log_file.read_text() == "buffered\nflushed\n"
+        
+        # Explicit flushes from the owner always go through
+        log(logging.INFO, "idle")
+        handler.flush()
+        assert log_file.read_text().endswith("idle\n")
+        handler.close()
+    
+    print("✓ Low-level records flushed on demand")
+    return True
+
+
 def main():
     print("=== Logging System Tests ===\n")
     
@@ -103,7 +224,12 @@ def main():
         test_verbose_mode,
         test_log_levels,
         test_log_file_creation,
-        test_global_logger
+        test_global_logger,
+        test_close_flushes_file,
+        test_rotation,
+        test_no_console_handler,
+        test_flush_when_idle,
+        test_flush_level
     ]
     
     results = []
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Test script for save location detection
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.save_detector import SaveLocationDetector
+
+
+def test_find_game_subdirs():
+    """Test matching game directories by name"""
+    print("Test 1: Finding game directories by name...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        (base / "Publisher" / "Hollow Knight").mkdir(parents=True)
+        (base / "Other Game").mkdir()
+        (base / "Temp" / "Hollow Knight").mkdir(parents=True)
+        
+        detector = SaveLocationDetector("linux")
+        matches = detector._find_game_subdirs(base, "Hollow Knight")
+        
+        assert matches == [base / "Publisher" / "Hollow Knight"]
+        print(f"  ✓ Matched: {matches[0]}")
+        return True
+
+
+def test_find_save_subdirs():
+    """Test locating directories that contain save files"""
+    print("\nTest 2: Finding save subdirectories...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        game_dir = Path(tmpdir) / "Game"
+        saves = game_dir / "Saves"
+        nested = saves / "slot1"
+        nested.mkdir(parents=True)
+        (saves / "profile.sav").write_text("")
+        (saves / "slot2.dat").write_text("")
+        (nested / "data.sav").write_text("")
+        (game_dir / "Cache").mkdir()
+        (game_dir / "Cache" / "cache.dat").write_text("")
+        (game_dir / "readme.txt").write_text("")
+        
+        detector = SaveLocationDetector("linux")
+        save_dirs = detector._find_save_subdirs(game_dir)
+        
+        # Parent save directory wins over its child, cache is skipped
+        assert save_dirs == [saves]
+        print(f"  ✓ Found: {save_dirs[0]}")
+        return True
+
+
+def test_game_matches_without_saves():
+    """Test matched game directory is returned when it holds no save files"""
+    print("\nTest 3: Game directory without save files...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base = Path(tmpdir)
+        (base / "Celeste").mkdir()
+        (base / "Celeste" / "settings.ini").write_text("")
+        
+        detector = SaveLocationDetector("linux")
+        matches = detector._find_game_subdirs(base, "Celeste")
+        
+        assert matches == [base / "Celeste"]
+        print("  ✓ Game directory returned as fallback")
+        return True
+
+
+def test_clean_game_name():
+    """Test game name cleaning"""
+    print("\nTest 4: Cleaning game names...")
+    
+    detector = SaveLocationDetector("linux")
+    assert detector._clean_game_name("Baldur's Gate 3") == "Baldurs Gate 3"
+    assert detector._clean_game_name("  Half-Life:   Alyx ") == "Half-Life Alyx"
+    assert detector._clean_game_name("Celeste") == "Celeste"
+    
+    print("  ✓ Names cleaned correctly")
+    return True
+
+
+def test_find_save_directories_game_dir():
+    """Test save directories inside the game installation directory"""
+    print("\nTest 5: Finding saves in game directory...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        game_dir = Path(tmpdir) / "MyGame"
+        (game_dir / "saves").mkdir(parents=True)
+        
+        game_info = {'name': 'Unlikely Game Name Xyzzy', 'start_dir': str(game_dir)}
+        detector = SaveLocationDetector("linux")
+        candidates = detector.find_save_directories(game_info)
+        
+        assert candidates == [game_dir / "saves"]
+        print(f"  ✓ Found: {candidates[0]}")
+        return True
+
+
+def test_expand_windows_path():
+    """Test Windows folder placeholder expansion"""
+    print("\nTest 6: Expanding Windows folder placeholders...")
+    
+    detector = SaveLocationDetector("windows")
+    home = Path.home()
+    
+    assert detector.expand_path("%APPDATA%/Game") == home / "AppData" / "Roaming" / "Game"
+    assert detector.expand_path("%DOCUMENTS%") == home / "Documents"
+    
+    # Common locations are probed once and returned as copies
+    first = detector.get_common_save_locations()
+    first.append(Path("/not/cached"))
+    assert Path("/not/cached") not in detector.get_common_save_locations()
+    
+    print("  ✓ Placeholders expanded")
+    return True
+
+
+def test_find_save_directories_proton():
+    """Test save directories inside a Proton prefix"""
+    print("\nTest 7: Finding saves in Proton prefix...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        steam_path = Path(tmpdir) / "Steam"
+        steamuser = steam_path / "steamapps" / "compatdata" / "3000000000" / "pfx" / "drive_c" / "users" / "steamuser"
+        roaming_saves = steamuser / "AppData" / "Roaming" / "Hades" / "Profiles"
+        documents = steamuser / "Documents" / "Hades"
+        roaming_saves.mkdir(parents=True)
+        documents.mkdir(parents=True)
+        (roaming_saves / "Profile1.sav").write_text("")
+        
+        game_info = {'name': 'Hades', 'app_id': 3000000000}
+        detector = SaveLocationDetector("linux")
+        candidates = detector.find_save_directories(game_info, steam_path)
+        
+        # Prefix locations keep their priority order
+        assert candidates == [roaming_saves, documents]
+        print(f"  ✓ Found {len(candidates)} location(s) in prefix")
+        return True
+
+
+def test_find_save_directories_cache():
+    """Test find_save_directories results are memoized"""
+    print("\nTest 8: Memoizing save directory lookups...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        game_dir = Path(tmpdir) / "MyGame"
+        (game_dir / "saves").mkdir(parents=True)
+        
+        game_info = {'name': 'Unlikely Game Name Xyzzy', 'start_dir': str(game_dir)}
+        detector = SaveLocationDetector("linux")
+        first = detector.find_save_directories(game_info)
+        
+        # New save folder is not seen until the cache is cleared
+        (game_dir / "SaveData").mkdir()
+        assert detector.find_save_directories(game_info) == first
+        
+        detector.clear_cache()
+        assert detector.find_save_directories(game_info) == [game_dir / "saves", game_dir / "SaveData"]
+        print("  ✓ Cached result reused until cleared")
+        return True
+
+
+def test_proton_prefix_from_start_dir():
+    """Test Proton prefix detection from a drive_c start directory"""
+    print("\nTest 9: Detecting prefix from start directory...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        drive_c = Path(tmpdir) / "prefix" / "drive_c"
+        game_dir = drive_c / "Games" / "Celeste"
+        game_dir.mkdir(parents=True)
+        
+        game_info = {'name': 'Celeste', 'app_id': 3000000001, 'start_dir': str(game_dir)}
+        detector = SaveLocationDetector("linux")
+        
+        # No Steam installation: falls back to the start_dir hint
+        assert detector.check_proton_prefix(game_info, None) == drive_c
+        assert detector.check_game_directory(game_info) == game_dir
+        print(f"  ✓ Prefix: {drive_c}")
+        return True
+
+
+def main():
+    print("=== Save Location Detection Tests ===\n")
+    
+    tests = [
+        test_find_game_subdirs,
+        test_find_save_subdirs,
+        test_game_matches_without_saves,
+        test_clean_game_name,
+        test_find_save_directories_game_dir,
+        test_expand_windows_path,
+        test_find_save_directories_proton,
+        test_find_save_directories_cache,
+        test_proton_prefix_from_start_dir
+    ]
+    
+    results = []
+    for test in tests:
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"  ✗ Test failed with exception: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append(False)
+    
+    print(f"\n=== Results: {sum(results)}/{len(results)} tests passed ===")
+    
+    if all(results):
+        print("✓ All tests passed!")
+        return 0
+    else:
+        print("✗ Some tests failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,16 +3,22 @@
 Test script for sync engine
 """
 
+import ctypes
+import errno
 import sys
 import os
 import tempfile
 import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Project root is put on sys.path by conftest.py under pytest
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.sync_engine import SyncEngine, SyncAction
+from src.sync_engine import SyncEngine, SyncAction, COMPARE_CHUNK_SIZE
+from src.fast_stat import fast_stat
+import src.fast_stat as fast_stat_module
 
 
 def test_file_only_local():
@@ -26,13 +32,19 @@ def test_file_only_local():
         cloud_dir.mkdir()
         
         # Create file only in local
-        (local_dir / "save.dat").write_text("local data")
+        (local_dir / "save.dat").write_bytes(b"local data")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir)
         
         assert len(comparisons) == 1
         assert comparisons[0].action == SyncAction.COPY_TO_CLOUD
+        
+        # First-sync fast path still returns comparisons sorted by name
+        (local_dir / "a.dat").write_bytes(b"more data")
+        comparisons = engine.compare_directories(local_dir, cloud_dir)
+        assert [c.filename for c in comparisons] == ["a.dat", "save.dat"]
+        assert all(c.cloud_path is None for c in comparisons)
         print("  ✓ Correctly identified: copy to cloud")
         return True
 
@@ -48,7 +60,7 @@ def test_file_only_cloud():
         cloud_dir.mkdir()
         
         # Create file only in cloud
-        (cloud_dir / "save.dat").write_text("cloud data")
+        (cloud_dir / "save.dat").write_bytes(b"cloud data")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir)
@@ -71,13 +83,13 @@ def test_local_newer():
         
         # Create cloud file first
         cloud_file = cloud_dir / "save.dat"
-        cloud_file.write_text("cloud data")
-        
-        time.sleep(0.1)
+        cloud_file.write_bytes(b"cloud data")
+        now = time.time()
+        os.utime(cloud_file, (now - 10, now - 10))
         
         # Create local file (newer)
         local_file = local_dir / "save.dat"
-        local_file.write_text("local data")
+        local_file.write_bytes(b"local data")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir)
@@ -100,13 +112,13 @@ def test_cloud_newer():
         
         # Create local file first
         local_file = local_dir / "save.dat"
-        local_file.write_text("local data")
-        
-        time.sleep(0.1)
+        local_file.write_bytes(b"local data")
+        now = time.time()
+        os.utime(local_file, (now - 10, now - 10))
         
         # Create cloud file (newer)
         cloud_file = cloud_dir / "save.dat"
-        cloud_file.write_text("cloud data")
+        cloud_file.write_bytes(b"cloud data")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir)
@@ -131,18 +143,18 @@ def test_conflict_detection():
         local_file = local_dir / "save.dat"
         cloud_file = cloud_dir / "save.dat"
         
-        local_file.write_text("old data")
-        cloud_file.write_text("old data")
+        local_file.write_bytes(b"old data")
+        cloud_file.write_bytes(b"old data")
+        now = time.time()
+        os.utime(local_file, (now - 20, now - 20))
+        os.utime(cloud_file, (now - 20, now - 20))
         
         # Record sync time
-        time.sleep(0.1)
-        last_sync = datetime.now().isoformat()
-        time.sleep(0.1)
+        last_sync = now - 10
         
         # Modify both files after sync
-        local_file.write_text("local modified")
-        time.sleep(0.1)
-        cloud_file.write_text("cloud modified")
+        local_file.write_bytes(b"local modified")
+        cloud_file.write_bytes(b"cloud modified")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir, last_sync)
@@ -164,10 +176,10 @@ def test_sync_summary():
         cloud_dir.mkdir()
         
         # Create various scenarios
-        (local_dir / "only_local.dat").write_text("data")
-        (cloud_dir / "only_cloud.dat").write_text("data")
-        (local_dir / "same.dat").write_text("data")
-        (cloud_dir / "same.dat").write_text("data")
+        (local_dir / "only_local.dat").write_bytes(b"data")
+        (cloud_dir / "only_cloud.dat").write_bytes(b"data")
+        (local_dir / "same.dat").write_bytes(b"data")
+        (cloud_dir / "same.dat").write_bytes(b"data")
         
         engine = SyncEngine()
         comparisons = engine.compare_directories(local_dir, cloud_dir)
@@ -197,8 +209,8 @@ def test_copy_file():
         
         # Create source file
         source_file = source_dir / "test.dat"
-        source_file.write_text("test data")
-        original_mtime = source_file.stat().st_mtime
+        source_file.write_bytes(b"test data")
+        os.utime(source_file, ns=(1_600_000_000_987_654_321, 1_600_000_000_987_654_321))
         
         # Copy file
         dest_file = dest_dir / "test.dat"
@@ -207,11 +219,10 @@ def test_copy_file():
         
         assert success
         assert dest_file.exists()
-        assert dest_file.read_text() == "test data"
+        assert dest_file.read_bytes() == b"test data"
         
-        # Check timestamp preserved
-        dest_mtime = dest_file.stat().st_mtime
-        assert abs(dest_mtime - original_mtime) < 0.01
+        # Check timestamps preserved to the nanosecond
+        assert dest_file.stat().st_mtime_ns == 1_600_000_000_987_654_321
         
         print("  ✓ File copied successfully with timestamp preserved")
         return True
@@ -228,26 +239,24 @@ def test_copy_file_permissions():
         dest_dir.mkdir()
         
         # Create existing file in dest with specific permissions
+        existing_mode = 0o640
         existing_file = dest_dir / "existing.dat"
-        existing_file.write_text("existing")
-        os.chmod(existing_file, 0o644)
+        existing_file.write_bytes(b"existing")
+        os.chmod(existing_file, existing_mode)
         
-        # Create source file
-        source_file = source_dir / "test.dat"
-        source_file.write_text("test data")
-        
-        # Copy file
-        dest_file = dest_dir / "test.dat"
+        # Copy several source files with a different mode
         engine = SyncEngine()
-        success = engine.copy_file(source_file, dest_file)
-        
-        assert success
-        assert dest_file.exists()
-        
-        # Check permissions match existing file
-        dest_mode = dest_file.stat().st_mode & 0o777
-        existing_mode = existing_file.stat().st_mode & 0o777
-        assert dest_mode == existing_mode
+        for i in range(5):
+            source_file = source_dir / f"test{i}.dat"
+            source_file.write_bytes(b"test data")
+            os.chmod(source_file, 0o600)
+            assert engine.copy_file(source_file, dest_dir / source_file.name)
+        
+        # Every copy takes the existing file's mode, looked up once
+        for i in range(5):
+            assert (dest_dir / f"test{i}.dat").stat().st_mode & 0o777 == existing_mode
+        assert engine._dir_mode_cache == {dest_dir: existing_mode}
+        dest_mode = existing_mode
         
         print(f"  ✓ Permissions matched existing files: {oct(dest_mode)}")
         return True
@@ -280,14 +289,24 @@ def test_create_backup():
         
         # Create file to backup
         test_file = file_dir / "save.dat"
-        test_file.write_text("important data")
+        test_file.write_bytes(b"important data")
+        os.chmod(test_file, 0o600)
+        os.utime(test_file, ns=(1_600_000_000_000_000_000, 1_600_000_000_123_456_789))
         
         engine = SyncEngine()
         backup_path = engine.create_backup(test_file, backup_dir, "local")
         
         assert backup_path is not None
         assert backup_path.exists()
-        assert backup_path.read_text() == "important data"
+        assert backup_path.read_bytes() == b"important data"
+        
+        # Backup keeps the original's mtime and permissions
+        backup_stat = backup_path.stat()
+        assert backup_stat.st_mtime_ns == 1_600_000_000_123_456_789
+        assert backup_stat.st_mode & 0o777 == 0o600
+        
+        # Missing files are not backed up
+        assert engine.create_backup(file_dir / "missing.dat", backup_dir, "local") is None
         
         # Check backup filename format
         assert "save.dat" in backup_path.name
@@ -308,24 +327,30 @@ def test_backup_with_timestamp():
         
         # Create file
         test_file = file_dir / "save.dat"
-        test_file.write_text("data v1")
+        test_file.write_bytes(b"data v1")
         
         engine = SyncEngine()
         
         # Create first backup
         backup1 = engine.create_backup(test_file, backup_dir, "local")
         
-        time.sleep(1.1)  # Ensure different timestamp
-        
-        # Modify and create second backup
-        test_file.write_text("data v2")
-        backup2 = engine.create_backup(test_file, backup_dir, "cloud")
+        # Modify and create second backup a second later
+        test_file.write_bytes(b"data v2")
+        later = (datetime.now() + timedelta(seconds=1)).strftime("%Y%m%d-%H%M%S")
+        backup2 = engine.create_backup(test_file, backup_dir, "cloud", later)
         
         assert backup1 != backup2
         assert backup1.exists()
         assert backup2.exists()
-        assert backup1.read_text() == "data v1"
-        assert backup2.read_text() == "data v2"
+        assert backup1.read_bytes() == b"data v1"
+        assert backup2.read_bytes() == b"data v2"
+        
+        # Repeat backups within the same second don't overwrite each other
+        test_file.write_bytes(b"data v3")
+        backup3 = engine.create_backup(test_file, backup_dir, "cloud", later)
+        assert backup3 == backup_dir / f"save.dat.{later}-1.cloud.backup"
+        assert backup2.read_bytes() == b"data v2"
+        assert backup3.read_bytes() == b"data v3"
         
         print(f"  ✓ Multiple backups with unique timestamps")
         return True
@@ -343,10 +368,10 @@ def test_sync_algorithm():
         cloud_dir.mkdir()
         
         # Create test scenario
-        (local_dir / "only_local.dat").write_text("local data")
-        (cloud_dir / "only_cloud.dat").write_text("cloud data")
-        (local_dir / "same.dat").write_text("same data")
-        (cloud_dir / "same.dat").write_text("same data")
+        (local_dir / "only_local.dat").write_bytes(b"local data")
+        (cloud_dir / "only_cloud.dat").write_bytes(b"cloud data")
+        (local_dir / "same.dat").write_bytes(b"same data")
+        (cloud_dir / "same.dat").write_bytes(b"same data")
         
         engine = SyncEngine()
         results = engine.sync_files(local_dir, cloud_dir, backup_dir)
@@ -378,9 +403,10 @@ def test_sync_with_backup():
         local_file = local_dir / "save.dat"
         cloud_file = cloud_dir / "save.dat"
         
-        cloud_file.write_text("old cloud data")
-        time.sleep(0.1)
-        local_file.write_text("new local data")
+        cloud_file.write_bytes(b"old cloud data")
+        now = time.time()
+        os.utime(cloud_file, (now - 10, now - 10))
+        local_file.write_bytes(b"new local data")
         
         engine = SyncEngine()
         results = engine.sync_files(local_dir, cloud_dir, backup_dir)
@@ -393,7 +419,7 @@ def test_sync_with_backup():
         assert any("cloud.backup" in b.name for b in backups)
         
         # Verify cloud file was updated
-        assert cloud_file.read_text() == "new local data"
+        assert cloud_file.read_bytes() == b"new local data"
         
         print(f"  ✓ Created {len(backups)} backup(s) before overwriting")
         return True
@@ -411,7 +437,7 @@ def test_dry_run():
         cloud_dir.mkdir()
         
         # Create test file
-        (local_dir / "test.dat").write_text("test data")
+        (local_dir / "test.dat").write_bytes(b"test data")
         
         engine = SyncEngine()
         results = engine.sync_files(local_dir, cloud_dir, backup_dir, dry_run=True)
@@ -433,6 +459,315 @@ def test_dry_run():
         return True
 
 
+def test_compare_uses_listing_stats():
+    """Test comparisons carry the stats gathered while listing"""
+    print("\nTest 15: File stats from directory listing...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud"
+        local_dir.mkdir()
+        (local_dir / "save.dat").write_bytes(b"12345")
+        (local_dir / "subdir").mkdir()
+        
+        # Missing cloud directory is treated as empty
+        engine = SyncEngine()
+        comparisons = engine.compare_directories(local_dir, cloud_dir)
+        
+        assert [c.filename for c in comparisons] == ["save.dat"]
+        comp = comparisons[0]
+        assert comp.local_stat is not None and comp.cloud_stat is None
+        assert comp.local_size == 5
+        assert comp.cloud_path is None
+        assert comp.action == SyncAction.COPY_TO_CLOUD
+        print("  ✓ Stats reused, directories ignored")
+        return True
+
+
+def test_fast_stat():
+    """Test cached stat matches os.stat"""
+    print("\nTest 16: Fast stat for cloud files...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "save.dat"
+        path.write_bytes(b"cloud data")
+        
+        fast = fast_stat(path)
+        regular = os.stat(path)
+        assert fast.st_size == regular.st_size
+        assert fast.st_mtime == regular.st_mtime
+        assert fast.st_mode == regular.st_mode
+        
+        try:
+            fast_stat(Path(tmpdir) / "missing.dat")
+            assert False, "Expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+        
+        print("  ✓ Fast stat matches os.stat")
+        return True
+
+
+def test_compare_cache():
+    """Test unchanged directories reuse the previous comparison"""
+    print("\nTest 17: Comparison cache...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud"
+        local_dir.mkdir()
+        cloud_dir.mkdir()
+        (local_dir / "save.dat").write_bytes(b"data")
+        (cloud_dir / "save.dat").write_bytes(b"data")
+        os.utime(local_dir / "save.dat", (1000, 1000))
+        os.utime(cloud_dir / "save.dat", (1000, 1000))
+        
+        engine = SyncEngine()
+        first = engine.compare_directories(local_dir, cloud_dir)
+        second = engine.compare_directories(local_dir, cloud_dir)
+        assert second[0] is first[0]
+        assert first[0].action == SyncAction.SKIP
+        
+        # Modified file invalidates the cached result
+        os.utime(local_dir / "save.dat", (2000, 2000))
+        third = engine.compare_directories(local_dir, cloud_dir)
+        assert third[0] is not first[0]
+        assert third[0].action == SyncAction.COPY_TO_CLOUD
+        
+        # Different last_sync is not served from the cache
+        fourth = engine.compare_directories(local_dir, cloud_dir, datetime.fromtimestamp(1500).isoformat())
+        assert fourth[0] is not third[0]
+        
+        print("  ✓ Cached until a file changes")
+        return True
+
+
+def test_sync_many_files():
+    """Test syncing many files in both directions"""
+    print("\nTest 18: Syncing many files...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud"
+        backup_dir = Path(tmpdir) / "backups"
+        local_dir.mkdir()
+        cloud_dir.mkdir()
+        
+        # Enough cloud files to take the batched stat path
+        for i in range(40):
+            (local_dir / f"local{i:02d}.sav").write_bytes(f"local {i}".encode())
+            (cloud_dir / f"cloud{i:02d}.sav").write_bytes(f"cloud {i}".encode())
+        
+        engine = SyncEngine()
+        results = engine.sync_files(local_dir, cloud_dir, backup_dir)
+        
+        assert results["success"]
+        assert results["files_synced"] == 80
+        assert not results["errors"]
+        assert [a["filename"] for a in results["actions"]] == sorted(a["filename"] for a in results["actions"])
+        assert all(a["success"] for a in results["actions"])
+        assert (cloud_dir / "local07.sav").read_bytes() == b"local 7"
+        assert (local_dir / "cloud13.sav").read_bytes() == b"cloud 13"
+        
+        # Batched cloud stats match a plain os.stat of each file
+        cloud_files = engine._get_files(cloud_dir, cached_stat=True)
+        assert len(cloud_files) == 80
+        assert all(st.st_mtime_ns == os.stat(cloud_dir / name).st_mtime_ns for name, st in cloud_files.items())
+        
+        print(f"  ✓ Synced {results['files_synced']} files")
+        return True
+
+
+def test_copy_identical_contents():
+    """Test copying over identical contents still syncs the timestamp"""
+    print("\nTest 19: Copy over identical file...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = Path(tmpdir) / "source.sav"
+        dest = Path(tmpdir) / "dest" / "source.sav"
+        dest.parent.mkdir()
+        source.write_bytes(b"same data" * 1000)
+        dest.write_bytes(b"same data" * 1000)
+        os.utime(source, (2000, 2000))
+        os.utime(dest, (1000, 1000))
+        
+        engine = SyncEngine()
+        assert engine.copy_file(source, dest)
+        assert dest.stat().st_mtime == 2000
+        assert dest.read_bytes() == source.read_bytes()
+        
+        # Same size, different bytes is still copied
+        source.write_bytes(b"diff data" * 1000)
+        assert engine.copy_file(source, dest)
+        assert dest.read_bytes() == source.read_bytes()
+        
+        # Files spanning several compare chunks, differing only in the tail
+        data = os.urandom(COMPARE_CHUNK_SIZE + 10)
+        source.write_bytes(data)
+        dest.write_bytes(data)
+        assert engine._same_contents(source, dest)
+        dest.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+        assert not engine._same_contents(source, dest)
+        
+        print("  ✓ Timestamp updated, contents kept in sync")
+        return True
+
+
+def test_has_changes():
+    """Test quick change check against a full comparison"""
+    print("\nTest 20: Quick change check...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud"
+        backup_dir = Path(tmpdir) / "backups"
+        local_dir.mkdir()
+        cloud_dir.mkdir()
+        (local_dir / "save1.dat").write_bytes(b"one")
+        (cloud_dir / "save2.dat").write_bytes(b"two")
+        
+        engine = SyncEngine()
+        assert engine.has_changes(local_dir, cloud_dir)
+        
+        engine.sync_files(local_dir, cloud_dir, backup_dir)
+        assert not engine.has_changes(local_dir, cloud_dir)
+        summary = engine.get_sync_summary(engine.compare_directories(local_dir, cloud_dir))
+        assert summary["skip"] == summary["total_files"] == 2
+        
+        # Both copies newer than last sync: reported as a change (conflict)
+        old_sync = datetime.fromtimestamp(time.time() - 3600).isoformat()
+        assert engine.has_changes(local_dir, cloud_dir, old_sync)
+        
+        os.utime(local_dir / "save1.dat", (time.time() + 10, time.time() + 10))
+        assert engine.has_changes(local_dir, cloud_dir)
+        
+        print("  ✓ Changes detected without full comparison")
+        return True
+
+
+def test_sync_insufficient_space():
+    """Test sync stops before copying when space is short"""
+    print("\nTest 21: Sync with insufficient disk space...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud"
+        backup_dir = Path(tmpdir) / "backups"
+        local_dir.mkdir()
+        cloud_dir.mkdir()
+        (local_dir / "save1.dat").write_bytes(b"12345")
+        (local_dir / "save2.dat").write_bytes(b"1234567890")
+        (cloud_dir / "save3.dat").write_bytes(b"abc")
+        
+        engine = SyncEngine()
+        checks = []
+        
+        def no_space(dest_dir, needed):
+            checks.append((dest_dir, needed))
+            return False
+        
+        engine.verify_disk_space = no_space
+        results = engine.sync_files(local_dir, cloud_dir, backup_dir)
+        
+        # Both sides share a filesystem: one check for the whole batch, nothing copied
+        assert checks == [(cloud_dir, 18)]
+        assert not results["success"]
+        assert "Not enough disk space" in results["errors"][0]
+        assert [p.name for p in cloud_dir.iterdir()] == ["save3.dat"]
+        assert not list(local_dir.glob("save3.dat"))
+        
+        print("  ✓ Sync aborted before copying")
+        return True
+
+
+
+def test_sync_creates_destination():
+    """Test sync creates a missing destination directory once"""
+    print("\nTest 22: Sync into missing directory...")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_dir = Path(tmpdir) / "local"
+        cloud_dir = Path(tmpdir) / "cloud" / "game"
+        backup_dir = Path(tmpdir) / "backups"
+        local_dir.mkdir()
+        for i in range(3):
+            (local_dir / f"save{i}.dat").write_bytes(b"data")
+        
+        engine = SyncEngine()
+        results = engine.sync_files(local_dir, cloud_dir, backup_dir)
+        
+        assert results["success"]
+        assert sorted(p.name for p in cloud_dir.iterdir()) == ["save0.dat", "save1.dat", "save2.dat"]
+        assert engine._ready_dirs == {cloud_dir}
+        
+        print("  ✓ Destination created before copying")
+        return True
+
+
+def test_fast_stat_refused():
+    """Test fast stat falls back to os.stat when statx is refused"""
+    print("\nTest 23: Fast stat with statx blocked...")
+    
+    def refused_statx(*args):
+        # What a seccomp filter that blocks statx looks like
+        ctypes.set_errno(errno.EPERM)
+        return -1
+    
+    saved = (fast_stat_module._statx, fast_stat_module._statx_loaded)
+    fast_stat_module._statx, fast_stat_module._statx_loaded = refused_statx, True
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cloud_dir = Path(tmpdir) / "cloud"
+            cloud_dir.mkdir()
+            for i in range(3):
+                (cloud_dir / f"save{i}.dat").write_bytes(b"cloud data")
+            
+            # Refused once, then os.stat is used for good
+            assert fast_stat(cloud_dir / "save0.dat").st_size == 10
+            assert fast_stat_module._load_statx() is None
+            
+            # Cloud entries are still listed, not dropped
+            engine = SyncEngine()
+            assert sorted(engine._get_files(cloud_dir, cached_stat=True)) == ["save0.dat", "save1.dat", "save2.dat"]
+    finally:
+        fast_stat_module._statx, fast_stat_module._statx_loaded = saved
+    
+    print("  ✓ Fell back to os.stat")
+    return True
+
+
+def test_copy_range_copies_nothing():
+    """Test copying falls back when copy_file_range reports 0 at the start"""
+    print("\nTest 24: Copy with copy_file_range copying nothing...")
+    
+    if not hasattr(os, "copy_file_range"):
+        print("  - copy_file_range not available, skipped")
+        return True
+    
+    real_copy_file_range = os.copy_file_range
+    os.copy_file_range = lambda *args: 0
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "save.dat"
+            dest = Path(tmpdir) / "copy.dat"
+            source.write_bytes(b"save data")
+            
+            engine = SyncEngine()
+            assert engine.copy_file(source, dest)
+            assert dest.read_bytes() == b"save data"
+            
+            # Empty files are still done after the first call
+            empty = Path(tmpdir) / "empty.dat"
+            empty.write_bytes(b"")
+            assert engine.copy_file(empty, dest)
+            assert dest.read_bytes() == b""
+    finally:
+        os.copy_file_range = real_copy_file_range
+    
+    print("  ✓ Fell back to a regular copy")
+    return True
+
+
 def main():
     print("=== Sync Engine Tests ===\n")
     
@@ -450,7 +785,17 @@ def main():
         test_backup_with_timestamp,
         test_sync_algorithm,
         test_sync_with_backup,
-        test_dry_run
+        test_dry_run,
+        test_compare_uses_listing_stats,
+        test_fast_stat,
+        test_compare_cache,
+        test_sync_many_files,
+        test_copy_identical_contents,
+        test_has_changes,
+        test_sync_insufficient_space,
+        test_sync_creates_destination,
+        test_fast_stat_refused,
+        test_copy_range_copies_nothing
     ]
     
     results = []